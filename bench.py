@@ -0,0 +1,322 @@
+# bench.py — Micro-Benchmarks für Persistenz, economy_loop und Leaderboard
+# Erzeugt synthetische Economies (Default 1k/100k/1M User) und misst die
+# heißen Pfade (core.py, Cogs, economy_loop) ohne Discord-Verbindung (Fake-Context/-Guild).
+# Jede Größe läuft in einem frischen Prozess in einem eigenen Temp-Verzeichnis.
+#
+#   python bench.py --out bench-abc123.json
+#   python bench.py --sizes 1000,100000 --accrual lazy
+#   python bench.py --compare bench-old.json bench-new.json --threshold 1.25
+#
+# --accrual push (Default hier) plant Lohn/Effekte im Scheduler ein, damit
+# der economy_loop-Durchlauf etwas zu tun hat; "lazy" misst den Bot-Default.
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import asyncio
+import argparse
+import platform
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import multiprocessing
+from typing import Any, Dict, List, Optional
+
+SAMPLE_SIZE = 10000       # User für Per-Call-Messungen (_ensure_user, effect_active)
+LEADERBOARD_REPEAT = 50
+JOB_NAMES = [("Baker", 150), ("Programmer", 300), ("Mechanic", 200), ("Teacher", 180)]
+EFFECTS = [("shield", {}), ("job_boost", {"percent": 25}), ("luck_boost", {"percent": 5})]
+
+
+# =========================
+# SYNTHETISCHE DATEN
+# =========================
+def _iso(ts: int) -> str:
+    return datetime.utcfromtimestamp(ts).isoformat()
+
+def _synthetic_profile(rng: random.Random, now: int, legacy: bool) -> Dict[str, Any]:
+    job = rng.choice(JOB_NAMES) if rng.random() < 0.6 else (None, 0)
+    prof = {
+        "wallet": rng.randint(0, 1_000_000),
+        "bank": rng.randint(0, 1_000_000),
+        "inventory": [],
+        "job": job[0],
+        "income": job[1],
+        "last_pay": now - rng.randint(0, 3 * 3600),
+        "job_offers": [],
+        "offers_expires": None,
+        "last_interest": now - rng.randint(0, 24 * 3600),
+        "effects": {},
+        "rob_cooldown_until": now + rng.randint(-3600, 3600) if rng.random() < 0.2 else None,
+    }
+    for key, extra in EFFECTS:
+        if rng.random() < 0.3:
+            prof["effects"][key] = dict(extra, until=now + rng.randint(-6 * 3600, 6 * 3600))
+    if legacy:
+        # Altformat: "money" statt "wallet", ISO-Zeitstempel, fehlende Felder
+        prof["money"] = prof.pop("wallet")
+        for field in ("last_pay", "last_interest", "rob_cooldown_until"):
+            if prof.get(field) is not None:
+                prof[field] = _iso(prof[field])
+        for eff in prof["effects"].values():
+            eff["until"] = _iso(eff["until"])
+        for field in ("job_offers", "offers_expires", "inventory"):
+            prof.pop(field)
+    return prof
+
+def generate(path: str, users: int, legacy_pct: float, seed: int) -> int:
+    rng = random.Random(seed)
+    now = int(time.time())
+    data = {
+        "users": {
+            str(10**17 + i): _synthetic_profile(rng, now, rng.random() < legacy_pct)
+            for i in range(users)
+        },
+        "meta": {},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    return os.path.getsize(path)
+
+
+# =========================
+# FAKE DISCORD
+# =========================
+class FakeMember:
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.display_name = f"Member {user_id % 100000}"
+        self.mention = f"<@{user_id}>"
+        self.bot = False
+
+class FakeGuild:
+    id = 1
+
+    def get_member(self, user_id: int) -> Optional[FakeMember]:
+        return None  # Gateway-Cache leer -> Batch über query_members
+
+    async def query_members(self, user_ids=None, limit=5, cache=True) -> List[FakeMember]:
+        return [FakeMember(uid) for uid in user_ids]
+
+class FakeMessage:
+    async def edit(self, **kwargs):
+        pass
+
+class FakeChannel:
+    id = 1
+
+class FakeContext:
+    interaction = None  # Prefix-Aufruf -> Antworten laufen über die Outbox-Queue
+
+    def __init__(self, author_id: int, guild: FakeGuild):
+        self.author = FakeMember(author_id)
+        self.guild = guild
+        self.channel = FakeChannel()
+        self.replies: List[str] = []
+
+    async def reply(self, content: Optional[str] = None, **kwargs) -> FakeMessage:
+        self.replies.append(content)
+        return FakeMessage()
+
+
+# =========================
+# MESSUNG (läuft im Worker-Prozess)
+# =========================
+def _timed(fn, *args) -> float:
+    t0 = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - t0
+
+async def _timed_async(coro) -> float:
+    t0 = time.perf_counter()
+    await coro
+    return time.perf_counter() - t0
+
+async def _run_async(bot, core, leaderboard, res: Dict[str, Any], sample: List[str]):
+    guild = FakeGuild()
+    ctx = FakeContext(int(sample[0]), guild)
+    pages = max(1, -(-len(core.rank_index) // core.LEADERBOARD_PAGE_SIZE))
+    core.outbox.rate = 10**9  # gemessen wird der Command, nicht Discords Channel-Limit
+
+    # Leaderboard: erster Aufruf mit leerem Namens-Cache, danach warm
+    res["leaderboard_cold_ms"] = await _timed_async(leaderboard.leaderboard_cmd.callback(leaderboard, ctx, 1)) * 1000
+    t = 0.0
+    for _ in range(LEADERBOARD_REPEAT):
+        t += await _timed_async(leaderboard.leaderboard_cmd.callback(leaderboard, ctx, 1))
+    res["leaderboard_ms"] = t / LEADERBOARD_REPEAT * 1000
+    await leaderboard.leaderboard_cmd.callback(leaderboard, ctx, pages)
+    t = 0.0
+    for _ in range(LEADERBOARD_REPEAT):
+        t += await _timed_async(leaderboard.leaderboard_cmd.callback(leaderboard, ctx, pages))
+    res["leaderboard_last_page_ms"] = t / LEADERBOARD_REPEAT * 1000
+    await core.outbox.flush()
+
+    # Ein economy_loop-Durchlauf über alle fälligen User
+    pending = len(core.scheduler)
+    if core.scheduler.next_deadline() is not None and core.scheduler.next_deadline() <= time.time():
+        res["economy_loop_pass_sec"] = await _timed_async(bot.economy_loop.coro())
+    else:
+        res["economy_loop_pass_sec"] = 0.0
+    res["economy_loop_deadlines"] = pending - len(core.scheduler)
+    res["economy_loop_dirty_users"] = core.economy.dirty_count
+
+    # Hintergrund-Flush aller User: Gesamtdauer und längste Blockade des Event-Loops
+    core.economy.mark_dirty(*core.economy.users)
+    stall = 0.0
+    async def ticker():
+        nonlocal stall
+        while True:
+            t0 = time.perf_counter()
+            await asyncio.sleep(0)
+            stall = max(stall, time.perf_counter() - t0)
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    res["flush_async_sec"] = await _timed_async(core.economy.flush_async())
+    tick.cancel()
+    res["flush_async_loop_stall_ms"] = stall * 1000
+
+def _run_size(users: int, args: argparse.Namespace) -> Dict[str, Any]:
+    workdir = tempfile.mkdtemp(prefix=f"bench-{users}-", dir=args.workdir)
+    try:
+        os.chdir(workdir)
+        res: Dict[str, Any] = {"users": users}
+        t0 = time.perf_counter()
+        res["data_file_bytes"] = generate("data.json", users, args.legacy_pct, args.seed)
+        res["generate_sec"] = time.perf_counter() - t0
+
+        os.environ["STORAGE_BACKEND"] = args.backend
+        os.environ["HOT_PROFILE_CAPACITY"] = str(args.hot_capacity)
+        os.environ["JOB_ACCRUAL_MODE"] = args.accrual
+        os.environ["DATA_FLUSH_INTERVAL_SEC"] = "3600"
+        t0 = time.perf_counter()
+        import bot  # erst hier: Dateipfade sind relativ zum Arbeitsverzeichnis
+        import core
+        from cogs.leaderboard import Leaderboard
+        res["import_bot_sec"] = time.perf_counter() - t0
+
+        res["load_data_sec"] = _timed(core.load_data)
+        res["rebuild_schedule_sec"] = _timed(core._rebuild_schedule)
+        res["rebuild_rank_index_sec"] = _timed(core._rebuild_rank_index)
+
+        sample = random.Random(args.seed).sample(list(core.economy.users), min(users, SAMPLE_SIZE))
+
+        # _ensure_user: erster Zugriff rechnet Zinsen/Lohn ab (Journal), zweiter ist der Normalfall
+        res["ensure_user_first_us"] = _timed(lambda: [core._ensure_user(uid) for uid in sample]) / len(sample) * 1e6
+        res["ensure_user_us"] = _timed(lambda: [core._ensure_user(uid) for uid in sample]) / len(sample) * 1e6
+
+        # effect_active-Churn: Effekt setzen, prüfen, ablaufen lassen
+        profs = [core.economy.users[uid] for uid in sample]
+        def churn():
+            for prof in profs:
+                core.add_effect(prof, "luck_boost", 1, {"percent": 5})
+                core.effect_active(prof, "luck_boost")
+                core.effect_active(prof, "job_boost")
+                prof.set_effect("luck_boost", 0, 5)  # sofort abgelaufen
+                core.effect_active(prof, "luck_boost")
+        res["effect_churn_us"] = _timed(churn) / len(profs) * 1e6
+        core.economy.mark_dirty(*sample)
+
+        asyncio.run(_run_async(bot, core, Leaderboard(bot.bot), res, sample))
+
+        res["save_dirty_users"] = core.economy.dirty_count
+        res["save_data_incremental_sec"] = _timed(core.save_data)
+        core.economy.mark_dirty(*core.economy.users)
+        res["save_data_full_sec"] = _timed(core.save_data)
+        return res
+    finally:
+        os.chdir(args.workdir or tempfile.gettempdir())
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+# =========================
+# VERGLEICH
+# =========================
+def compare(base_path: str, new_path: str, threshold: float) -> int:
+    with open(base_path, "r", encoding="utf-8") as f:
+        base = json.load(f)
+    with open(new_path, "r", encoding="utf-8") as f:
+        new = json.load(f)
+    regressions = 0
+    print(f"{base['meta'].get('commit')} -> {new['meta'].get('commit')} (threshold x{threshold})")
+    for size, cur in new["results"].items():
+        old = base["results"].get(size)
+        if not old:
+            continue
+        print(f"\n{size} users")
+        for metric, value in cur.items():
+            if not metric.endswith(("_sec", "_ms", "_us")) or not old.get(metric):
+                continue
+            ratio = value / old[metric]
+            flag = ""
+            if ratio > threshold:
+                flag = "  <-- REGRESSION"
+                regressions += 1
+            print(f"  {metric:<28} {old[metric]:>12.4f} -> {value:>12.4f}  x{ratio:.2f}{flag}")
+    return 1 if regressions else 0
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)), stderr=subprocess.DEVNULL,
+        ).decode().strip()
+    except Exception:
+        return None
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark bot.py hot paths on synthetic economies")
+    ap.add_argument("--sizes", default="1000,100000,1000000", help="comma-separated user counts")
+    ap.add_argument("--backend", choices=("json", "sqlite"), default="json")
+    ap.add_argument("--accrual", choices=("push", "lazy"), default="push")
+    ap.add_argument("--hot-capacity", type=int, default=0, help="profiles kept in memory (sqlite only, 0 = all)")
+    ap.add_argument("--legacy-pct", type=float, default=0.1, help="share of old-format profiles to migrate")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--workdir", default=None, help="where temporary economies are created")
+    ap.add_argument("--keep", action="store_true", help="keep the generated data directories")
+    ap.add_argument("--out", default="bench.json")
+    ap.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"), help="compare two result files")
+    ap.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio flagged as regression")
+    args = ap.parse_args(argv)
+
+    if args.compare:
+        return compare(args.compare[0], args.compare[1], args.threshold)
+
+    # bot.py liegt neben bench.py; der Worker importiert es aus dem Temp-Verzeichnis
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    results: Dict[str, Any] = {}
+    for size in [int(s) for s in args.sizes.split(",") if s.strip()]:
+        print(f"[bench] {size} users ...", flush=True)
+        # frischer Prozess je Größe: bot.py hält seinen Zustand modulglobal
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            res = pool.submit(_run_size, size, args).result()
+        results[str(size)] = res
+        print(json.dumps(res, indent=2), flush=True)
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": int(time.time()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backend": args.backend,
+            "hot_capacity": args.hot_capacity,
+            "accrual": args.accrual,
+            "legacy_pct": args.legacy_pct,
+        },
+        "results": results,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"[bench] results written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+# catalog.py — Gecachte Job-/Item-Kataloge (jobs.json, items.json)
+# Einmal laden, Lookup-Map und optional gerenderte Anzeige vorbauen;
+# neu geladen wird nur, wenn sich die mtime der Datei ändert.
+
+import os
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+
+class Catalog:
+    def __init__(
+        self,
+        path: str,
+        key: str,
+        default: List[Dict[str, Any]],
+        render: Optional[Callable[[List[Dict[str, Any]]], str]] = None,
+    ):
+        self.path = path
+        self.key = key
+        self.default = default
+        self._render = render
+        self._mtime: Optional[float] = None
+        self._items: List[Dict[str, Any]] = []
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._listing = ""
+        self.loads = 0
+
+    def _refresh(self):
+        if not os.path.exists(self.path):
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.default, f, indent=2, ensure_ascii=False)
+        mtime = os.stat(self.path).st_mtime
+        if mtime == self._mtime:
+            return
+        try:
+            self.reload()
+        except Exception as e:
+            if self._mtime is None:
+                raise
+            # halb gespeicherte/kaputte Datei: alten Stand weiter ausliefern,
+            # erneuter Versuch erst bei der nächsten Änderung
+            self._mtime = mtime
+            print(f"[catalog] reload of {self.path} failed, keeping previous version: {e}")
+
+    def reload(self) -> int:
+        # erzwingt das Neuladen (z. B. /catalog_reload); gibt die Anzahl Einträge zurück
+        with open(self.path, "r", encoding="utf-8") as f:
+            items = json.load(f)
+        self._mtime = os.stat(self.path).st_mtime
+        self._items = items
+        self._index = {it[self.key]: it for it in items}
+        self._listing = self._render(items) if self._render else ""
+        self.loads += 1
+        return len(items)
+
+    @property
+    def items(self) -> List[Dict[str, Any]]:
+        self._refresh()
+        return self._items
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        self._refresh()
+        return self._index.get(key)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    @property
+    def listing(self) -> str:
+        self._refresh()
+        return self._listing
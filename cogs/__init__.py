@@ -0,0 +1 @@
+# cogs — Discord-Extensions mit den Spieler-Commands (per gitupdate einzeln neu ladbar)
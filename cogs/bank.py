@@ -0,0 +1,65 @@
+# cogs/bank.py — Einzahlen/Abheben (hybrid) + Legacy-Prefix-Gruppe "bank"
+
+from discord.ext import commands
+
+from config import PREFIX
+from core import economy, show_stats_text, outbox, throttle
+
+
+class Bank(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.hybrid_command(name="bank_deposit", description="Deposit from wallet to bank")
+    @throttle("bank")
+    async def bank_deposit_cmd(self, ctx: commands.Context, amount: int):
+        if amount <= 0:
+            return await outbox.reply(ctx, "❌ Enter a positive amount.")
+        async with economy.transaction(ctx.author.id, op="deposit") as tx:
+            prof = tx[ctx.author.id]
+            if amount > prof["wallet"]:
+                return await outbox.reply(ctx, "❌ Not enough in wallet.")
+            prof["wallet"] -= amount
+            prof["bank"] += amount
+            tx.info["amount"] = amount
+        await outbox.reply(ctx, f"💵 Deposited **${amount}**.\n" + show_stats_text(prof))
+
+    @commands.hybrid_command(name="bank_withdraw", description="Withdraw from bank to wallet")
+    @throttle("bank")
+    async def bank_withdraw_cmd(self, ctx: commands.Context, amount: int):
+        if amount <= 0:
+            return await outbox.reply(ctx, "❌ Enter a positive amount.")
+        async with economy.transaction(ctx.author.id, op="withdraw") as tx:
+            prof = tx[ctx.author.id]
+            if amount > prof["bank"]:
+                return await outbox.reply(ctx, "❌ Not enough on bank.")
+            prof["bank"] -= amount
+            prof["wallet"] += amount
+            tx.info["amount"] = amount
+        await outbox.reply(ctx, f"💵 Withdrew **${amount}**.\n" + show_stats_text(prof))
+
+    # Legacy prefix bank group (für Kompatibilität)
+    @commands.group(name="bank", invoke_without_command=True)
+    async def bank_group(self, ctx: commands.Context):
+        await outbox.reply(
+            ctx,
+            f"🏦 Usage:\n`{PREFIX}bank deposit <amount>`\n`{PREFIX}bank withdraw <amount>`"
+        )
+
+    @bank_group.command(name="deposit")
+    @throttle("bank")
+    async def bank_deposit_prefix(self, ctx: commands.Context, amount: int = None):
+        if amount is None:
+            return await outbox.reply(ctx, "Usage: !bank deposit <amount>")
+        await ctx.invoke(self.bank_deposit_cmd, amount=amount)
+
+    @bank_group.command(name="withdraw")
+    @throttle("bank")
+    async def bank_withdraw_prefix(self, ctx: commands.Context, amount: int = None):
+        if amount is None:
+            return await outbox.reply(ctx, "Usage: !bank withdraw <amount>")
+        await ctx.invoke(self.bank_withdraw_cmd, amount=amount)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Bank(bot))
@@ -0,0 +1,137 @@
+# cogs/casino.py — Slots (inkl. Multi-Spin), Roulette, Blackjack
+# Quoten und Auflösung kommen aus games.py (geteilt mit simulate.py).
+# Ergebnisse gehen über die Outbox; Folge-Ergebnisse werden zusammengefasst.
+
+import asyncio
+from typing import Literal
+
+from discord.ext import commands
+
+from config import SLOTS_MAX_SPINS
+from core import economy, get_slots_luck_bonus, show_stats_text, outbox, throttle
+from games import (
+    SLOTS_SYMBOLS, SLOTS_JACKPOT_MULT, SLOTS_TWOMATCH_MULT, ROULETTE_CHOICES,
+    slots_spin, slots_payout_table, slots_batch, roulette_spin, blackjack_draw,
+)
+
+
+class Casino(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    # =========================
+    # SLOTS (hybrid)
+    # =========================
+    @commands.hybrid_command(name="slots", description="Spin the slot machine")
+    @throttle("casino")
+    async def slots_cmd(self, ctx: commands.Context, bet: int, spins: int = 1):
+        if bet <= 0:
+            return await outbox.reply(ctx, "❌ Bet must be positive.")
+        if spins < 1 or spins > SLOTS_MAX_SPINS:
+            return await outbox.reply(ctx, f"❌ Spins must be between 1 and {SLOTS_MAX_SPINS}.")
+        total_bet = bet * spins
+        async with economy.transaction(ctx.author.id, op="slots") as tx:
+            prof = tx[ctx.author.id]
+            if total_bet > prof["wallet"]:
+                return await outbox.reply(ctx, "❌ Not enough money.")
+
+            prof["wallet"] -= total_bet
+
+            # Luck boost: kleine Chance, einen Slot zu "nudgen" (z. B. 0–5%)
+            luck = get_slots_luck_bonus(prof)  # Prozent
+            if spins == 1:
+                rolls, win_mult = slots_spin(SLOTS_SYMBOLS, luck, SLOTS_JACKPOT_MULT, SLOTS_TWOMATCH_MULT)
+                mults = [win_mult]
+            else:
+                # Multi-Spin: alle Spins in einem Rutsch über die Auszahlungstabelle
+                table = slots_payout_table(len(SLOTS_SYMBOLS), luck, SLOTS_JACKPOT_MULT, SLOTS_TWOMATCH_MULT)
+                mults = slots_batch(spins, table)
+
+            winnings = bet * sum(mults)
+            prof["wallet"] += winnings
+            tx.info.update(bet=bet, spins=spins, win=winnings)
+
+        if spins == 1:
+            outcome = "🎉 JACKPOT!" if win_mult == SLOTS_JACKPOT_MULT else ("✅ Small win!" if win_mult == SLOTS_TWOMATCH_MULT else "❌ No win.")
+            # Net change anzeigen
+            change = winnings if winnings > 0 else -bet
+            change_str = f"+${change}" if change > 0 else f"-${abs(change)}"
+            # key="slots": schnelle Folge-Spins landen in derselben (editierten) Nachricht
+            return await outbox.reply(ctx, f"🎰 | {' '.join(rolls)} | {outcome}\nResult: **{change_str}**\n" + show_stats_text(prof), key="slots")
+
+        jackpots = mults.count(SLOTS_JACKPOT_MULT)
+        small = mults.count(SLOTS_TWOMATCH_MULT)
+        change = winnings - total_bet
+        change_str = f"+${change}" if change >= 0 else f"-${abs(change)}"
+        await outbox.reply(
+            ctx,
+            f"🎰 | {spins} spins à ${bet} | 🎉 {jackpots} jackpot(s) • ✅ {small} small win(s) • ❌ {spins - jackpots - small} no win\n"
+            f"Result: **{change_str}**\n" + show_stats_text(prof),
+            key="slots"
+        )
+
+    # =========================
+    # ROULETTE (hybrid)
+    # =========================
+    @commands.hybrid_command(name="roulette", description="Roulette bet")
+    @throttle("casino")
+    async def roulette_cmd(self, ctx: commands.Context, bet: int, choice: Literal["red", "black", "odd", "even"]):
+        if bet <= 0:
+            return await outbox.reply(ctx, "❌ Bet must be positive.")
+
+        # Lock bleibt über den Spin hinweg gehalten -> kein Lost Update
+        async with economy.transaction(ctx.author.id, op="roulette") as tx:
+            profile = tx[ctx.author.id]
+            if bet > profile["wallet"]:
+                return await outbox.reply(ctx, "❌ Not enough money.")
+
+            result = roulette_spin()
+            msg = await outbox.reply(ctx, "🎰 Spinning the wheel...")
+            await asyncio.sleep(2)
+
+            win = (ROULETTE_CHOICES[choice] == result)
+            if win:
+                profile["wallet"] += bet
+                outcome = "🎉 You won!"
+            else:
+                profile["wallet"] -= bet
+                outcome = "❌ You lost!"
+            tx.info.update(bet=bet, win=win)
+
+        # noch nicht gesendet (volle Queue) -> geht direkt mit dem Ergebnis raus
+        await outbox.edit(msg, f"🎰 The wheel landed on **{result}**!\n{outcome}\n" + show_stats_text(profile))
+
+    # =========================
+    # BLACKJACK (hybrid, simple)
+    # =========================
+    @commands.hybrid_command(name="blackjack", description="Simple blackjack duel")
+    @throttle("casino")
+    async def blackjack_cmd(self, ctx: commands.Context, bet: int):
+        if bet <= 0:
+            return await outbox.reply(ctx, "❌ Bet must be positive.")
+        async with economy.transaction(ctx.author.id, op="blackjack") as tx:
+            profile = tx[ctx.author.id]
+            if bet > profile["wallet"]:
+                return await outbox.reply(ctx, "❌ Not enough money.")
+
+            player_card, dealer_card = blackjack_draw()
+            if player_card > dealer_card:
+                profile["wallet"] += bet
+                result = "🎉 You won!"
+            elif player_card < dealer_card:
+                profile["wallet"] -= bet
+                result = "❌ You lost!"
+            else:
+                result = "🤝 It's a tie!"
+            tx.info["bet"] = bet
+
+        await outbox.reply(
+            ctx,
+            f"🃏 **Blackjack**\nYour card: **{player_card}**\nDealer's card: **{dealer_card}**\n{result}\n" +
+            show_stats_text(profile),
+            key="blackjack"
+        )
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Casino(bot))
@@ -0,0 +1,121 @@
+# cogs/economy.py — Profil-Basics (start, stats, balance) und Hilfe
+
+import discord
+from discord.ext import commands
+
+from config import PREFIX, JOB_OFFERS_COUNT, JOB_OFFERS_TTL_MIN, ROB_COOLDOWN_MIN, LEADERBOARD_PAGE_SIZE, BANK_INTEREST_RATE
+from core import _ensure_user, get_user_profile, show_stats_text, outbox
+from games import LOTTO_TICKET_PRICE
+
+
+class Economy(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    # =========================
+    # HELP (hybrid)
+    # =========================
+    @commands.hybrid_command(name="help", description="Show all commands")
+    async def help_cmd(self, ctx: commands.Context):
+        embed = discord.Embed(
+            title="🎮 Economy & Casino – Commands",
+            description=f"Prefix: `{PREFIX}`  •  Slash: `/`",
+            color=0x2ecc71
+        )
+        embed.add_field(
+            name="Profile",
+            value="\n".join([
+                f"`{PREFIX}start` / `/start` – Create profile",
+                f"`{PREFIX}stats` / `/stats` – Show stats",
+                f"`{PREFIX}balance` / `/balance` – Wallet & Bank"
+            ]),
+            inline=False
+        )
+        embed.add_field(
+            name="Jobs",
+            value="\n".join([
+                f"`{PREFIX}jobs` / `/jobs` – Show {JOB_OFFERS_COUNT} random offers (valid {JOB_OFFERS_TTL_MIN} min)",
+                f"`{PREFIX}job <number>` / `/job number:` – Claim a job"
+            ]),
+            inline=False
+        )
+        bank_lines = [
+            f"`{PREFIX}bank deposit <amount>` / `/bank_deposit amount:`",
+            f"`{PREFIX}bank withdraw <amount>` / `/bank_withdraw amount:`",
+        ]
+        if BANK_INTEREST_RATE > 0:
+            bank_lines.append(f"Bank balance earns {BANK_INTEREST_RATE:.2%} interest per day (interest boosts raise the rate)")
+        embed.add_field(
+            name="Bank",
+            value="\n".join(bank_lines),
+            inline=False
+        )
+        embed.add_field(
+            name="Casino",
+            value="\n".join([
+                f"`{PREFIX}slots <bet> [spins]` / `/slots bet: spins:`",
+                f"`{PREFIX}roulette <bet> <red|black|odd|even>` / `/roulette ...`",
+                f"`{PREFIX}blackjack <bet>` / `/blackjack bet:`",
+            ]),
+            inline=False
+        )
+        embed.add_field(
+            name="Lottery",
+            value="\n".join([
+                f"`{PREFIX}lotto_buy [count]` / `/lotto_buy count:` – Buy tickets ({LOTTO_TICKET_PRICE} each)",
+                f"`{PREFIX}lotto_draw` / `/lotto_draw` – Draw winner (admin)"
+            ]),
+            inline=False
+        )
+        embed.add_field(
+            name="PvP Rob",
+            value=f"`{PREFIX}rob @user` / `/rob user:` – Steal from a user (cooldown {ROB_COOLDOWN_MIN} min, shield blocks)",
+            inline=False
+        )
+        embed.add_field(
+            name="Shop",
+            value="\n".join([
+                f"`{PREFIX}shop list` / `/shop_list`",
+                f"`{PREFIX}shop buy <key>` / `/shop_buy key:`",
+                f"`{PREFIX}catalog_reload` / `/catalog_reload` – Reload jobs & items (admin)"
+            ]),
+            inline=False
+        )
+        embed.add_field(
+            name="Leaderboard",
+            value="\n".join([
+                f"`{PREFIX}leaderboard [page]` / `/leaderboard page:` – Top {LEADERBOARD_PAGE_SIZE} by net worth",
+                f"`{PREFIX}rank [@user]` / `/rank user:` – Your position",
+            ]),
+            inline=False
+        )
+        await outbox.reply(ctx, embed=embed)
+
+    # =========================
+    # BASICS (hybrid)
+    # =========================
+    @commands.hybrid_command(name="start", description="Create profile")
+    async def start_cmd(self, ctx: commands.Context):
+        _ensure_user(ctx.author.id)
+        profile = get_user_profile(ctx.author.id)
+        await outbox.reply(
+            ctx,
+            f"✨ Profile ready! You start with **$ {profile['wallet']}**.\n" +
+            show_stats_text(profile)
+        )
+
+    @commands.hybrid_command(name="stats", description="Show your stats")
+    async def stats_cmd(self, ctx: commands.Context):
+        _ensure_user(ctx.author.id)
+        profile = get_user_profile(ctx.author.id)
+        await outbox.reply(ctx, show_stats_text(profile))
+
+    @commands.hybrid_command(name="balance", description="Wallet & Bank")
+    async def balance_cmd(self, ctx: commands.Context):
+        _ensure_user(ctx.author.id)
+        p = get_user_profile(ctx.author.id)
+        await outbox.reply(ctx, f"💰 Wallet: ${p['wallet']}\n🏦 Bank: ${p['bank']}")
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Economy(bot))
@@ -0,0 +1,64 @@
+# cogs/jobs.py — Job-Angebote anzeigen und annehmen
+
+from discord.ext import commands
+
+from config import JOB_OFFERS_COUNT, JOB_OFFERS_TTL_MIN
+from core import economy, jobs_catalog, load_jobs, get_random_jobs, _now, _fmt_ts, outbox
+
+
+class Jobs(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.hybrid_command(name="jobs", description="Show random job offers")
+    async def jobs_cmd(self, ctx: commands.Context):
+        async with economy.transaction(ctx.author.id, op="job_offers") as tx:
+            prof = tx[ctx.author.id]
+            offers_valid = False
+            if prof.get("job_offers"):
+                exp = prof.get("offers_expires")
+                if exp and _now() < exp:
+                    offers_valid = True
+
+            if not offers_valid:
+                jobs_list = load_jobs()
+                selected = get_random_jobs(jobs_list, JOB_OFFERS_COUNT)
+                prof["job_offers"] = [j["name"] for j in selected]
+                prof["offers_expires"] = _now() + JOB_OFFERS_TTL_MIN * 60
+
+        lines = []
+        for i, name in enumerate(prof["job_offers"], start=1):
+            info = jobs_catalog.get(name) or {"income": "?"}
+            lines.append(f"**{i}.** {name} – {info['income']} Coins/hour")
+        await outbox.reply(
+            ctx,
+            "Available jobs (valid until {} UTC):\n{}\nUse `!job <number>` or `/job number:` to claim."
+            .format(_fmt_ts(prof['offers_expires']), "\n".join(lines))
+        )
+
+    @commands.hybrid_command(name="job", description="Claim a job")
+    async def job_cmd(self, ctx: commands.Context, number: int):
+        async with economy.transaction(ctx.author.id, op="job") as tx:
+            prof = tx[ctx.author.id]
+            exp = prof.get("offers_expires")
+            if not prof.get("job_offers") or not exp or _now() > exp:
+                return await outbox.reply(ctx, "❌ No valid job offers. Use `!jobs` first.")
+            if number < 1 or number > len(prof["job_offers"]):
+                return await outbox.reply(ctx, "❌ Invalid job number.")
+
+            chosen_name = prof["job_offers"][number - 1]
+            chosen = jobs_catalog.get(chosen_name)
+            if not chosen:
+                return await outbox.reply(ctx, "❌ This job no longer exists.")
+
+            prof["job"] = chosen["name"]
+            prof["income"] = int(chosen["income"])
+            prof["last_pay"] = _now()
+            prof["job_offers"] = []
+            prof["offers_expires"] = None
+            tx.info["job"] = chosen["name"]
+        await outbox.reply(ctx, f"✅ You took **{chosen['name']}**: {chosen['income']} /h.")
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Jobs(bot))
@@ -0,0 +1,56 @@
+# cogs/leaderboard.py — Rangliste nach Net Worth und eigener Rang
+
+from typing import List, Optional
+
+import discord
+from discord.ext import commands
+
+from config import LEADERBOARD_PAGE_SIZE
+from core import economy, rank_index, get_user_profile, resolve_names, _net_worth, outbox
+
+
+def _leaderboard_page(page: int) -> List[tuple]:
+    offset = (page - 1) * LEADERBOARD_PAGE_SIZE
+    # angezeigte User einmal lesen (rechnet im Lazy-Modus offenen Lohn ab),
+    # danach die ggf. verschobene Seite frisch aus dem Index holen
+    for uid, _ in rank_index.page(offset, LEADERBOARD_PAGE_SIZE):
+        get_user_profile(uid)
+    return rank_index.page(offset, LEADERBOARD_PAGE_SIZE)
+
+
+class Leaderboard(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.hybrid_command(name="leaderboard", description="Top players by net worth")
+    async def leaderboard_cmd(self, ctx: commands.Context, page: int = 1):
+        pages = max(1, -(-len(rank_index) // LEADERBOARD_PAGE_SIZE))
+        if page < 1 or page > pages:
+            return await outbox.reply(ctx, f"❌ Page must be between 1 and {pages}.")
+        top = _leaderboard_page(page)
+        names = await resolve_names(ctx.guild, [int(uid) for uid, _ in top])
+        lines = []
+        for idx, (uid, net) in enumerate(top, start=(page - 1) * LEADERBOARD_PAGE_SIZE + 1):
+            lines.append(f"**{idx}.** {names[int(uid)]} – ${net}")
+        if not lines:
+            lines = ["No players yet."]
+        await outbox.reply(
+            ctx,
+            f"🏆 **Leaderboard (Net Worth)** – Page {page}/{pages}\n" + "\n".join(lines)
+        )
+
+    @commands.hybrid_command(name="rank", description="Show your leaderboard position")
+    async def rank_cmd(self, ctx: commands.Context, user: Optional[discord.Member] = None):
+        target = user or ctx.author
+        if str(target.id) not in economy.users:
+            return await outbox.reply(ctx, f"{target.display_name} has no profile yet.")
+        prof = get_user_profile(target.id)
+        pos = rank_index.rank(str(target.id))
+        await outbox.reply(
+            ctx,
+            f"🏅 **{target.display_name}** is rank **#{pos}** of {len(rank_index)} with **${_net_worth(prof)}**."
+        )
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Leaderboard(bot))
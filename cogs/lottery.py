@@ -0,0 +1,67 @@
+# cogs/lottery.py — Lotto-Tickets kaufen und Gewinner ziehen
+
+from discord.ext import commands
+
+from config import LOTTO_MAX_TICKETS_PER_BUY
+from core import economy, lottery, save_lottery, resolve_names, _iso, outbox, throttle
+from games import LOTTO_TICKET_PRICE, LOTTO_WIN_PCT, draw_lottery_winner
+
+
+class Lottery(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.hybrid_command(name="lotto_buy", description="Buy lottery tickets")
+    @throttle("casino")
+    async def lotto_buy_cmd(self, ctx: commands.Context, count: int = 1):
+        if count < 1 or count > LOTTO_MAX_TICKETS_PER_BUY:
+            return await outbox.reply(ctx, f"❌ Count must be between 1 and {LOTTO_MAX_TICKETS_PER_BUY}.")
+        cost = LOTTO_TICKET_PRICE * count
+        uid = str(ctx.author.id)
+        async with economy.transaction(ctx.author.id, op="lotto_ticket") as tx:
+            prof = tx[ctx.author.id]
+            if prof["wallet"] < cost:
+                return await outbox.reply(ctx, f"❌ Need ${cost}.")
+
+            prof["wallet"] -= cost
+            tx.info.update(count=count, price=LOTTO_TICKET_PRICE)
+
+            lottery["tickets"][uid] = lottery["tickets"].get(uid, 0) + count
+            lottery["jackpot"] = int(lottery.get("jackpot", 0)) + cost
+        save_lottery()
+
+        owned = lottery["tickets"][uid]
+        total = sum(lottery["tickets"].values())
+        await outbox.reply(
+            ctx,
+            f"🎟️ {count} ticket(s) purchased! You hold **{owned}** of {total} tickets "
+            f"({owned / total:.1%}). Current jackpot: ${lottery['jackpot']}."
+        )
+
+    @commands.hybrid_command(name="lotto_draw", description="Draw a lottery winner (admin)")
+    @commands.has_permissions(manage_guild=True)
+    async def lotto_draw_cmd(self, ctx: commands.Context):
+        if not lottery.get("tickets"):
+            return await outbox.reply(ctx, "No tickets sold yet.")
+
+        winner_id = int(draw_lottery_winner(lottery["tickets"]))
+        jackpot_win = int(lottery["jackpot"] * LOTTO_WIN_PCT)
+
+        # Reset lottery (rest „verfällt“) – vor dem Auszahlen, damit während des
+        # Wartens auf den Gewinner-Lock gekaufte Tickets nicht verloren gehen
+        lottery["last_draw"] = _iso()
+        lottery["tickets"] = {}
+        lottery["jackpot"] = 0
+        save_lottery()
+
+        async with economy.transaction(winner_id, op="lotto_win") as tx:
+            tx[winner_id]["wallet"] += jackpot_win
+            tx.info["amount"] = jackpot_win
+
+        # Mention braucht keinen Member-Lookup; Name für den Fall, dass er den Server verlassen hat
+        names = await resolve_names(ctx.guild, [winner_id])
+        await outbox.reply(ctx, f"🎉 Lottery Winner: **<@{winner_id}>** ({names[winner_id]}) wins **${jackpot_win}**!")
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Lottery(bot))
@@ -0,0 +1,59 @@
+# cogs/rob.py — PvP-Raub (Cooldown, Shield, Beute/Strafe aus games.py)
+
+import discord
+from discord.ext import commands
+
+from config import ROB_COOLDOWN_MIN
+from core import economy, effect_active, _now, outbox, throttle
+from games import rob_attempt
+
+
+class Rob(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.hybrid_command(name="rob", description="Attempt to rob another user")
+    @throttle("rob")
+    async def rob_cmd(self, ctx: commands.Context, user: discord.Member):
+        if user.id == ctx.author.id:
+            return await outbox.reply(ctx, "❌ You cannot rob yourself.")
+        if user.bot:
+            return await outbox.reply(ctx, "❌ You cannot rob bots.")
+
+        # beide Profile in einer Transaktion (ein Journal-Eintrag, kein halber Rob)
+        async with economy.transaction(ctx.author.id, user.id, op="rob") as tx:
+            attacker = tx[ctx.author.id]
+            victim = tx[user.id]
+
+            # Check cooldown
+            rc = attacker.get("rob_cooldown_until")
+            if rc and _now() < rc:
+                mins = (rc - _now()) // 60
+                return await outbox.reply(ctx, f"⌛ Rob cooldown active: {mins} min left.")
+
+            # Victim shield?
+            if effect_active(victim, "shield"):
+                return await outbox.reply(ctx, "🛡️ Target is protected by a shield.")
+
+            if victim["wallet"] <= 0:
+                return await outbox.reply(ctx, "Target has nothing to steal.")
+
+            # Attempt
+            success, loot, fine = rob_attempt(victim["wallet"], attacker["wallet"])
+            if success:
+                victim["wallet"] -= loot
+                attacker["wallet"] += loot
+                msg = f"😈 Success! You stole **${loot}** from {user.mention}."
+            else:
+                attacker["wallet"] -= fine
+                msg = f"🚨 Caught! You paid a fine of **${fine}**."
+
+            # Set cooldown
+            attacker["rob_cooldown_until"] = _now() + ROB_COOLDOWN_MIN * 60
+            tx.info["success"] = success
+
+        await outbox.reply(ctx, msg)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Rob(bot))
@@ -0,0 +1,84 @@
+# cogs/shop.py — Shop (Items, Shields, Boosts), Katalog-Reload + Legacy-Prefix-Gruppe "shop"
+
+from discord.ext import commands
+
+from config import PREFIX
+from core import economy, items_catalog, jobs_catalog, add_effect, show_stats_text, outbox, throttle, shop_item_available
+
+
+class Shop(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.hybrid_command(name="shop_list", description="List shop items")
+    @throttle("shop")
+    async def shop_list_cmd(self, ctx: commands.Context):
+        await outbox.reply(ctx, items_catalog.listing)
+
+    @commands.hybrid_command(name="shop_buy", description="Buy a shop item by key")
+    @throttle("shop")
+    async def shop_buy_cmd(self, ctx: commands.Context, key: str):
+        key = key.lower().strip()
+        item = items_catalog.get(key)
+        if not item:
+            return await outbox.reply(ctx, "❌ Invalid item key. Use `!shop list`.")
+        if not shop_item_available(item):
+            return await outbox.reply(ctx, "❌ This item is not available (bank interest is disabled).")
+
+        async with economy.transaction(ctx.author.id, op="shop_buy") as tx:
+            prof = tx[ctx.author.id]
+            price = int(item["price"])
+            if prof["wallet"] < price:
+                return await outbox.reply(ctx, "❌ Not enough money.")
+
+            prof["wallet"] -= price
+            itype = item["type"]
+
+            if itype == "cosmetic":
+                prof.add_item(item["name"])
+            elif itype == "shield":
+                add_effect(prof, "shield", item.get("duration_hours", 24))
+            elif itype == "job_boost":
+                add_effect(prof, "job_boost", item.get("duration_hours", 6), {"percent": int(item.get("percent", 0))})
+            elif itype == "luck_boost":
+                add_effect(prof, "luck_boost", item.get("duration_hours", 6), {"percent": int(item.get("percent", 0))})
+            elif itype == "interest_boost":
+                add_effect(prof, "interest_boost", item.get("duration_hours", 24), {"percent": int(item.get("percent", 0))})
+            else:
+                prof.add_item(item["name"])  # fallback
+            tx.info.update(key=key, price=price)
+        await outbox.reply(ctx, f"✅ Purchased **{item['name']}** for **${price}**.\n" + show_stats_text(prof))
+
+    @commands.hybrid_command(name="catalog_reload", description="Reload jobs.json and items.json (admin)")
+    @commands.has_permissions(manage_guild=True)
+    async def catalog_reload_cmd(self, ctx: commands.Context):
+        try:
+            jobs = jobs_catalog.reload()
+            items = items_catalog.reload()
+        except Exception as e:
+            return await outbox.reply(ctx, f"❌ Reload failed: {e}")
+        await outbox.reply(ctx, f"🔄 Catalog reloaded: {jobs} jobs, {items} items.")
+
+    # Legacy prefix shop group (Kompatibilität)
+    @commands.group(name="shop", invoke_without_command=True)
+    async def shop_group(self, ctx: commands.Context):
+        await outbox.reply(
+            ctx,
+            f"🛒 Usage:\n`{PREFIX}shop list`\n`{PREFIX}shop buy <key>`"
+        )
+
+    @shop_group.command(name="list")
+    @throttle("shop")
+    async def shop_list_prefix(self, ctx: commands.Context):
+        await ctx.invoke(self.shop_list_cmd)
+
+    @shop_group.command(name="buy")
+    @throttle("shop")
+    async def shop_buy_prefix(self, ctx: commands.Context, key: str = None):
+        if not key:
+            return await outbox.reply(ctx, "Usage: !shop buy <key>")
+        await ctx.invoke(self.shop_buy_cmd, key=key)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Shop(bot))
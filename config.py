@@ -0,0 +1,94 @@
+# config.py — Einstellungen für Bot, Cogs und Hilfsskripte
+# Zentral, damit Extensions (cogs/) sie importieren können, ohne bot.py zu laden.
+
+import os
+
+# =========================
+# CONFIG
+# =========================
+TOKEN = os.getenv("DISCORD_BOT_TOKEN") or "PASTE_YOUR_TOKEN_HERE"
+PREFIX = "!"
+DATA_FILE = "data.json"
+SQLITE_FILE = "data.db"
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "json")  # "json" (Default) oder "sqlite"
+HOT_PROFILE_CAPACITY = int(os.getenv("HOT_PROFILE_CAPACITY", "0"))  # >0 (nur sqlite): max. Profile im Speicher, Rest auf Platte
+JOBS_FILE = "jobs.json"
+ITEMS_FILE = "items.json"
+LOTTO_FILE = "lottery.json"
+JOURNAL_FILE = "data.journal"
+JOURNAL_ENABLED = os.getenv("JOURNAL_ENABLED", "1") == "1"  # Mutationen sofort anhängen
+JOURNAL_FSYNC = os.getenv("JOURNAL_FSYNC", "0") == "1"      # fsync pro Eintrag (langsamer, crash-fest)
+SCHEDULE_FILE = "schedule.json"  # persistierter Deadline-Index
+COMMAND_SYNC_FILE = "command_sync.json"  # Fingerprint des zuletzt synchronisierten Command-Trees
+FORCE_COMMAND_SYNC = os.getenv("FORCE_COMMAND_SYNC", "0") == "1"
+DATA_FLUSH_INTERVAL_SEC = int(os.getenv("DATA_FLUSH_INTERVAL_SEC", "10"))  # Write-Behind/Kompaktierung
+METRICS_HOST = "127.0.0.1"  # Prometheus-Endpunkt nur lokal
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))  # 0 = aus
+ADMIN_IDS = [1121504039146889248, 806806527192334356]  # gitupdate, metrics, profile
+PROFILE_MAX_SEC = 60  # /profile: längstes Messfenster
+
+# Economy / Game Settings
+JOB_OFFERS_COUNT = 3
+JOB_OFFERS_TTL_MIN = 30
+JOB_ACCRUAL_MODE = os.getenv("JOB_ACCRUAL_MODE", "lazy")  # "lazy" (beim Lesen abrechnen) oder "push" (economy_loop)
+SCHEDULE_LOCK_RETRY_SEC = 5  # User in laufender Transaktion -> später erneut prüfen
+ROB_COOLDOWN_MIN = 60
+# Zins pro Tag, stetig verzinst: 0.001 ≈ +44 % pro Jahr (0.01 wären ~×37); 0 = aus,
+# dann verschwinden auch die interest_boost-Items aus dem Shop
+BANK_INTEREST_RATE = float(os.getenv("BANK_INTEREST_RATE", "0.001"))
+BANK_INTEREST_CAP = int(os.getenv("BANK_INTEREST_CAP", "1000000"))    # Zinsen nur bis zu diesem Bank-Stand (0 = ohne Grenze)
+# Quoten (Slots, Roulette, Blackjack, Rob, Lotto) stehen in games.py
+
+SLOTS_MAX_SPINS = 100  # Multi-Spin: max. Spins pro Befehl
+
+LEADERBOARD_PAGE_SIZE = 10
+NAME_CACHE_SIZE = 5000        # Anzeigenamen (Leaderboard/Lotto) im Speicher
+NAME_CACHE_TTL_SEC = 3600
+NAME_CACHE_LOG_EVERY = 500    # Hit-Ratio alle N Lookups loggen
+
+LOTTO_MAX_TICKETS_PER_BUY = 1000
+
+# Throttling pro User und Command-Gruppe: (Burst, Sekunden) -> max. Burst Aufrufe am Stück,
+# danach Burst pro Zeitraum
+THROTTLE_LIMITS = {
+    "casino": (5, 10.0),
+    "bank": (5, 10.0),
+    "rob": (3, 30.0),
+    "shop": (5, 10.0),
+}
+
+# Antwort-Queue (Prefix-Commands): Discord erlaubt ca. 5 Nachrichten/Edits pro 5 s und Channel
+OUTBOX_CHANNEL_RATE = 5
+OUTBOX_CHANNEL_PER_SEC = 5.0
+OUTBOX_COALESCE_SEC = 10      # Folge-Ergebnisse (z. B. Slots) so lange in dieselbe Nachricht editieren
+OUTBOX_COALESCE_MAX = 5       # max. Ergebnisse pro Sammelnachricht
+
+# Job Defaults (werden in jobs.json abgelegt)
+DEFAULT_JOBS = [
+    {"name": "Baker",       "income": 150},
+    {"name": "Programmer",  "income": 300},
+    {"name": "Mechanic",    "income": 200},
+    {"name": "Streamer",    "income": 100},
+    {"name": "Teacher",     "income": 180},
+    {"name": "Pilot",       "income": 400},
+    {"name": "Designer",    "income": 220},
+    {"name": "Doctor",      "income": 260},
+    {"name": "Police",      "income": 210},
+]
+
+# Boost Defaults (werden auch in items.json abgelegt)
+DEFAULT_ITEMS = [
+    # Permanentes Deko-Item-Beispiel
+    {"key": "watch", "name": "Watch", "price": 50, "type": "cosmetic"},
+    {"key": "necklace", "name": "Necklace", "price": 100, "type": "cosmetic"},
+    {"key": "laptop", "name": "Laptop", "price": 300, "type": "cosmetic"},
+
+    # Shield (blockt Robs)
+    {"key": "shield_24h", "name": "Shield 24h", "price": 500, "type": "shield", "duration_hours": 24},
+
+    # Boosts
+    {"key": "boost_job10_6h", "name": "Job Boost +10% (6h)", "price": 400, "type": "job_boost", "percent": 10, "duration_hours": 6},
+    {"key": "boost_job25_6h", "name": "Job Boost +25% (6h)", "price": 900, "type": "job_boost", "percent": 25, "duration_hours": 6},
+    {"key": "boost_luck5_6h", "name": "Luck Boost +5% (6h)", "price": 350, "type": "luck_boost", "percent": 5, "duration_hours": 6},
+    {"key": "boost_interest10_24h", "name": "Interest Boost +10% (24h)", "price": 800, "type": "interest_boost", "percent": 10, "duration_hours": 24},
+]
@@ -0,0 +1,444 @@
+# core.py — Gemeinsamer Zustand und Hilfsfunktionen für bot.py und die Cogs
+# Persistenz (Economy, Journal, Scheduler, Rang-Index), Kataloge, Lotterie,
+# Effekte/Jobs, Namensauflösung, Throttling und die Antwort-Queue. Wird beim Hot-Reload der Cogs nicht neu
+# geladen, der In-Memory-Zustand bleibt also erhalten.
+
+import os
+import json
+import math
+import time
+import random
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+import discord
+from discord.ext import commands
+
+from config import *
+from economy import Economy
+from userprofile import UserProfile, Effect
+from storage import Journal, open_backend
+from scheduler import DeadlineScheduler
+from leaderboard import RankIndex
+from namecache import NameCache
+from catalog import Catalog
+from metrics import Metrics
+from outbox import Outbox
+from ratelimit import TokenBuckets, Throttled
+
+# Metriken (Command-Latenzen, Persistenz- und Discord-Zeit, economy_loop)
+metrics = Metrics("bot")
+
+# =========================
+# PERSISTENCE
+# =========================
+# {"jackpot": int, "tickets": {user_id: Anzahl}, "last_draw": ISO}; wird in-place
+# geladen, damit Cogs dieselbe Referenz behalten
+lottery: Dict[str, Any] = {}
+
+# Zeitstempel in Profilen: ganzzahlige Epoch-Sekunden (UTC)
+def _now() -> int:
+    return int(time.time())
+
+def _iso(ts: Optional[int] = None) -> str:
+    return datetime.utcfromtimestamp(_now() if ts is None else ts).isoformat()
+
+def _fmt_ts(ts: int) -> str:
+    return datetime.utcfromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
+
+def _parse_iso(s: Optional[str]) -> Optional[datetime]:
+    if not s:
+        return None
+    try:
+        return datetime.fromisoformat(s)
+    except Exception:
+        return None
+
+_EPOCH = datetime(1970, 1, 1)
+_TS_FIELDS = ("last_pay", "last_interest", "offers_expires", "rob_cooldown_until")
+
+def _iso_to_ts(value: Any) -> Optional[int]:
+    # Altformat (naive UTC-ISO-String) -> Epoch-Sekunden; Zahlen bleiben erhalten
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value)
+    dt = _parse_iso(value)
+    return int((dt - _EPOCH).total_seconds()) if dt else None
+
+def _migrate_timestamps(prof: Dict[str, Any]) -> bool:
+    changed = False
+    for field in _TS_FIELDS:
+        value = prof.get(field)
+        if value is not None and not isinstance(value, int):
+            prof[field] = _iso_to_ts(value)
+            changed = True
+    for eff in prof.get("effects", {}).values():
+        until = eff.get("until")
+        if until is not None and not isinstance(until, int):
+            eff["until"] = _iso_to_ts(until)
+            changed = True
+    return changed
+
+def _new_profile() -> UserProfile:
+    # Profile liegen als UserProfile im Speicher (JSON-Layout: UserProfile.to_dict)
+    return UserProfile(wallet=1000, last_pay=_now(), last_interest=_now())
+
+# ---- Schema-Migrationen: laufen einmal in economy.load() (meta.schema_version),
+# jeder Schritt gibt zurück, ob er das Profil geändert hat. Neue Schritte nur
+# hinten anhängen, bestehende nie umsortieren.
+def _migrate_money(prof: Dict[str, Any]) -> bool:
+    # Altformat: "money" statt "wallet"
+    if "money" not in prof:
+        return False
+    money = prof.pop("money")
+    prof.setdefault("wallet", money or 0)
+    return True
+
+def _migrate_defaults(prof: Dict[str, Any]) -> bool:
+    # fehlende Felder ergänzen (Profile aus älteren Versionen)
+    missing = [k for k in _new_profile_keys if k not in prof]
+    if not missing:
+        return False
+    defaults = _new_profile().to_dict()
+    defaults["wallet"] = 0  # Startguthaben nur für neue Profile
+    for k in missing:
+        prof[k] = defaults[k]
+    return True
+
+_new_profile_keys = tuple(_new_profile().to_dict())
+
+MIGRATIONS = [
+    ("money_to_wallet", _migrate_money),
+    ("epoch_timestamps", _migrate_timestamps),
+    ("default_fields", _migrate_defaults),
+]
+
+# Authoritativer In-Memory-Store: wird einmal in on_ready geladen,
+# Änderungen werden journalt + als "dirty" markiert, data_flusher schreibt
+# gebündelt einen Snapshot und kompaktiert dabei das Journal.
+economy = Economy(
+    open_backend(STORAGE_BACKEND, DATA_FILE, SQLITE_FILE),
+    new_profile=_new_profile,
+    decode=UserProfile.from_dict,
+    migrations=MIGRATIONS,
+    journal=Journal(JOURNAL_FILE, fsync=JOURNAL_FSYNC) if JOURNAL_ENABLED else None,
+    settle=lambda uid, prof: _settle_on_read(uid, prof),
+    cache_capacity=HOT_PROFILE_CAPACITY,
+)
+if economy.journal is not None:
+    metrics.instrument(economy.journal, "append", "persistence")
+
+# Deadline-Index: nächste Job-Zahlung, Effekt-Enden, Rob-Cooldown pro User
+scheduler = DeadlineScheduler(SCHEDULE_FILE)
+
+def _deadlines(prof: UserProfile) -> Dict[str, int]:
+    # Lazy-Modus: Lohn wird beim Lesen abgerechnet, abgelaufene Effekte/Cooldowns
+    # werden beim Lesen ignoriert bzw. entfernt -> inaktive User kosten nichts
+    if JOB_ACCRUAL_MODE == "lazy":
+        return {}
+    due = {}
+    if prof.get("job") and prof.get("income", 0) > 0:
+        last = prof.get("last_pay")
+        if last:
+            due["pay"] = last + 3600
+    for key, eff in prof.effects():
+        if eff.until:
+            due[f"effect:{key}"] = eff.until
+    rc = prof.get("rob_cooldown_until")
+    if rc:
+        due["rob_cooldown"] = rc
+    return due
+
+def _reschedule(uid: str, prof: UserProfile):
+    scheduler.replace(uid, _deadlines(prof))
+
+economy.add_listener(_reschedule)
+
+def _rebuild_schedule():
+    # Persistierten Index übernehmen, wenn er zum Snapshot passt; sonst einmal voll aufbauen
+    if scheduler.restore(economy.loaded_seq):
+        for uid in economy.recovered:
+            _reschedule(uid, economy.users[uid])
+        print(f"[scheduler] restored {len(scheduler)} deadlines")
+        return
+    for uid, prof in economy.users.items():
+        _reschedule(uid, prof)
+    print(f"[scheduler] rebuilt {len(scheduler)} deadlines from {len(economy.users)} users")
+
+# Rang-Index nach Net Worth, bei jeder übernommenen Änderung aktualisiert
+rank_index = RankIndex()
+
+def _net_worth(prof: UserProfile) -> int:
+    return int(prof.get("wallet", 0)) + int(prof.get("bank", 0))
+
+def _update_rank(uid: str, prof: UserProfile):
+    rank_index.update(uid, _net_worth(prof))
+
+economy.add_listener(_update_rank)
+
+def _rebuild_rank_index():
+    rank_index.rebuild({uid: _net_worth(prof) for uid, prof in economy.users.items()})
+
+def _ensure_user(user_id: int):
+    economy.get(user_id)
+
+def load_data():
+    economy.load()  # inkl. ausstehender Schema-Migrationen (MIGRATIONS)
+
+def save_data():
+    economy.flush()
+    if scheduler.changed:
+        scheduler.write(scheduler.dump(economy.meta.get("journal_seq", 0)))
+
+def get_user_profile(user_id: int) -> UserProfile:
+    return economy.get(user_id)
+
+def set_user_profile(user_id: int, profile: UserProfile, op: str = "set", **info):
+    # op/info landen im Journal (z. B. op="deposit", amount=100); Dicts im JSON-Layout werden übernommen
+    if isinstance(profile, dict):
+        profile = UserProfile.from_dict(profile)
+    economy.put(user_id, profile, op, **info)
+
+# ---- jobs & items & lottery files
+def shop_item_available(item: Dict[str, Any]) -> bool:
+    # Zins-Boosts ohne Zinsen wären wirkungslos
+    return item["type"] != "interest_boost" or BANK_INTEREST_RATE > 0
+
+def _render_shop(items: List[Dict[str, Any]]) -> str:
+    lines = []
+    for it in filter(shop_item_available, items):
+        line = f"**{it['name']}** (${it['price']}) – key: `{it['key']}`"
+        if it["type"] == "shield":
+            line += f" • Shield {it.get('duration_hours', 0)}h"
+        elif it["type"].endswith("_boost"):
+            line += f" • +{it.get('percent', 0)}% for {it.get('duration_hours', 0)}h"
+        lines.append(line)
+    return "🛒 **Shop Items**\n" + "\n".join(lines)
+
+# Kataloge: einmal laden, nur bei geänderter mtime neu einlesen
+jobs_catalog = Catalog(JOBS_FILE, "name", DEFAULT_JOBS)
+items_catalog = Catalog(ITEMS_FILE, "key", DEFAULT_ITEMS, render=_render_shop)
+
+def load_jobs() -> List[Dict[str, Any]]:
+    return jobs_catalog.items
+
+def load_items() -> List[Dict[str, Any]]:
+    return items_catalog.items
+
+def load_lottery():
+    lottery.clear()
+    if not os.path.exists(LOTTO_FILE):
+        lottery.update({"jackpot": 0, "tickets": {}, "last_draw": None})
+        save_lottery()
+        return
+    with open(LOTTO_FILE, "r", encoding="utf-8") as f:
+        lottery.update(json.load(f))
+    tickets = lottery.get("tickets") or {}
+    if isinstance(tickets, list):
+        # Altformat: ein {"user_id": ...} pro Ticket -> Anzahl pro User
+        counts: Dict[str, int] = {}
+        for t in tickets:
+            counts[t["user_id"]] = counts.get(t["user_id"], 0) + 1
+        lottery["tickets"] = counts
+        save_lottery()
+    else:
+        lottery["tickets"] = tickets
+
+def save_lottery():
+    with metrics.track("persistence"):
+        tmp = LOTTO_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(lottery, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, LOTTO_FILE)
+
+def get_random_jobs(jobs: List[Dict[str, Any]], count=JOB_OFFERS_COUNT):
+    return random.sample(jobs, min(count, len(jobs)))
+
+# =========================
+# HELPERS
+# =========================
+def effect_active(profile: UserProfile, key: str) -> Optional[Effect]:
+    eff = profile.effect(key)
+    if not eff:
+        return None
+    if eff.until and _now() < eff.until:
+        return eff
+    # abgelaufen -> löschen
+    profile.clear_effect(key)
+    return None
+
+def add_effect(profile: UserProfile, key: str, hours: int, extra: Optional[Dict[str, Any]] = None):
+    profile.set_effect(key, _now() + int(hours * 3600), int((extra or {}).get("percent", 0)))
+
+def get_job_income_with_boost(profile: UserProfile, hours: int = 1, start: Optional[int] = None) -> int:
+    base = int(profile.get("income", 0))
+    if start is None:
+        # aktueller Stundenlohn (Anzeige)
+        jb = effect_active(profile, "job_boost")
+        if jb:
+            base = int(round(base * (1 + jb.percent/100.0)))
+        return base * hours
+    # Zeitraum [start, start + hours): eine Stunde zählt geboostet, wenn sie
+    # vor Ablauf des Boosts endet (wie bei stündlicher Auszahlung)
+    jb = profile.effect("job_boost")
+    until = jb.until if jb else None
+    if not until:
+        return base * hours
+    boosted_hours = min(hours, max(0, (until - start) // 3600))
+    boosted = int(round(base * (1 + jb.percent/100.0)))
+    return boosted * boosted_hours + base * (hours - boosted_hours)
+
+def accrue_job_pay(profile: UserProfile, now: int) -> int:
+    # Zahlt alle vollen Stunden seit last_pay aus; gibt den Betrag zurück
+    if not profile.get("job") or profile.get("income", 0) <= 0:
+        return 0
+    last = profile.get("last_pay") or now
+    hours = (now - last) // 3600
+    if hours <= 0:
+        return 0
+    payout = get_job_income_with_boost(profile, hours, start=last)
+    profile["wallet"] = int(profile.get("wallet", 0)) + int(payout)
+    profile["last_pay"] = last + hours * 3600
+    return payout
+
+def _interest_factor(rate: float, seconds: int) -> float:
+    # Tageszins stetig über `seconds` verzinst: (1 + rate) ** (seconds / 1 Tag)
+    return math.exp(math.log1p(rate) * seconds / 86400)
+
+def accrue_interest(profile: UserProfile, now: int) -> int:
+    # Verzinst die Bank seit last_interest in geschlossener Form (O(1), egal wie lange
+    # der User inaktiv war); der Zeitraum wird am Ende eines interest_boost geteilt.
+    # Gibt den gutgeschriebenen ganzzahligen Betrag zurück.
+    last = profile.get("last_interest")
+    if last is None or now <= last:
+        return 0
+    if BANK_INTEREST_RATE <= 0:
+        # abgeschaltet: Uhr trotzdem weiterstellen, damit ein späteres Einschalten
+        # nicht rückwirkend verzinst (ohne Journal, wird mit der nächsten Änderung gespeichert)
+        profile["last_interest"] = now
+        return 0
+    profile["last_interest"] = now
+    bank = int(profile.get("bank", 0))
+    balance = bank + profile.get("interest_carry", 0.0)
+    if balance <= 0 or (BANK_INTEREST_CAP and balance >= BANK_INTEREST_CAP):
+        return 0
+    ib = profile.effect("interest_boost")
+    until = ib.until if ib else None
+    if until and until > last:
+        end = min(until, now)
+        boosted = BANK_INTEREST_RATE * (1 + ib.percent / 100.0)
+        balance *= _interest_factor(boosted, end - last)
+        last = end
+    balance *= _interest_factor(BANK_INTEREST_RATE, now - last)
+    if BANK_INTEREST_CAP:
+        balance = min(balance, float(BANK_INTEREST_CAP))
+    profile["bank"] = int(balance)
+    profile["interest_carry"] = balance - profile["bank"]
+    return profile["bank"] - bank
+
+def _settle_on_read(uid: str, profile: UserProfile):
+    # Abrechnung bei jedem Lesen: Zinsen immer, Lohn nur im Lazy-Modus (sonst economy_loop).
+    # Ohne Auszahlung wird nicht gejournalt: last_interest/interest_carry lassen sich
+    # aus dem gespeicherten Stand identisch nachrechnen.
+    now = _now()
+    if JOB_ACCRUAL_MODE == "lazy":
+        payout = accrue_job_pay(profile, now)
+        if payout:
+            economy.record("payout", uid, amount=int(payout))
+    interest = accrue_interest(profile, now)
+    if interest:
+        economy.record("interest", uid, amount=interest)
+
+def get_slots_luck_bonus(profile: UserProfile) -> int:
+    lb = effect_active(profile, "luck_boost")
+    return lb.percent if lb else 0
+
+def show_stats_text(profile: UserProfile) -> str:
+    inv = profile.inventory
+    inv_text = ", ".join(f"{name} ×{n}" if n > 1 else name for name, n in inv.items()) if inv else "Empty"
+    shield = effect_active(profile, "shield")
+    shield_info = f"Active (until {_fmt_ts(shield.until)} UTC)" if shield else "None"
+    job_line = f"{profile.get('job') or 'None'} ({get_job_income_with_boost(profile)} /h)" if profile.get("job") else "None"
+    return (
+        f"💰 **Wallet:** ${profile.get('wallet', 0)}\n"
+        f"🏦 **Bank:** ${profile.get('bank', 0)}\n"
+        f"👔 **Job:** {job_line}\n"
+        f"🛡️ **Shield:** {shield_info}\n"
+        f"🎒 **Inventory:** {inv_text}"
+    )
+
+# =========================
+# MEMBER NAMES (Cache + gebündelte Auflösung)
+# =========================
+name_cache = NameCache(NAME_CACHE_SIZE, NAME_CACHE_TTL_SEC)
+
+metrics.gauge("users", lambda: len(economy.users), "Known profiles (in memory and paged out)")
+metrics.gauge("hot_profiles", lambda: economy.cache.resident if economy.cache else len(economy.users), "Profiles in memory")
+metrics.gauge("profile_cache_hits", lambda: economy.cache.hits if economy.cache else 0, "Profile lookups served from memory")
+metrics.gauge("profile_cache_misses", lambda: economy.cache.misses if economy.cache else 0, "Profile lookups loaded from disk")
+metrics.gauge("profile_cache_evictions", lambda: economy.cache.evictions if economy.cache else 0, "Profiles paged out")
+metrics.gauge("dirty_users", lambda: economy.dirty_count, "Profiles waiting for the next flush")
+metrics.gauge("scheduled_deadlines", lambda: len(scheduler), "Pending economy_loop deadlines")
+metrics.gauge("name_cache_hit_ratio", lambda: name_cache.hit_ratio, "Member name cache hit ratio")
+_name_lookups_logged = 0
+
+async def resolve_names(guild: discord.Guild, user_ids: List[int]) -> Dict[int, str]:
+    global _name_lookups_logged
+    names, missing = name_cache.lookup(guild.id, user_ids)
+    # 1) Gateway-Cache, 2) Rest in einem query_members-Request (max. 100 IDs)
+    still_missing = []
+    for uid in missing:
+        member = guild.get_member(uid)
+        if member:
+            name_cache.put(guild.id, uid, member.display_name)
+            names[uid] = member.display_name
+        else:
+            still_missing.append(uid)
+    for i in range(0, len(still_missing), 100):
+        chunk = still_missing[i:i + 100]
+        try:
+            members = await guild.query_members(user_ids=chunk, limit=len(chunk), cache=True)
+        except Exception as e:
+            print(f"[namecache] query_members failed: {e}")
+            members = []
+        found = {m.id: m.display_name for m in members}
+        for uid in chunk:
+            name_cache.put(guild.id, uid, found.get(uid))  # None = kein Member
+            names[uid] = found.get(uid)
+    lookups = name_cache.hits + name_cache.misses
+    if lookups - _name_lookups_logged >= NAME_CACHE_LOG_EVERY:
+        _name_lookups_logged = lookups
+        print(f"[namecache] hit ratio {name_cache.hit_ratio:.1%} ({name_cache.hits}/{lookups}), size {len(name_cache)}")
+    return {uid: (name or f"User {uid}") for uid, name in names.items()}
+
+# =========================
+# THROTTLING (Token-Bucket pro User und Command-Gruppe)
+# =========================
+throttles = {group: TokenBuckets(burst, per) for group, (burst, per) in THROTTLE_LIMITS.items()}
+
+def throttle(group: str):
+    # Command-Check wie @commands.has_permissions: läuft vor dem Handler, also vor
+    # Transaktions-Lock und Persistenz; Fehler -> on_command_error
+    buckets = throttles[group]
+    def predicate(ctx: commands.Context) -> bool:
+        retry_after = buckets.take(ctx.author.id)
+        if retry_after:
+            metrics.inc("throttled_total", group=group)
+            raise Throttled(group, retry_after)
+        return True
+    return commands.check(predicate)
+
+metrics.gauge("throttle_buckets", lambda: sum(len(b) for b in throttles.values()), "Active per-user throttle buckets")
+
+# =========================
+# REPLIES (Rate-Limit pro Channel, Coalescing)
+# =========================
+outbox = Outbox(OUTBOX_CHANNEL_RATE, OUTBOX_CHANNEL_PER_SEC, OUTBOX_COALESCE_SEC, OUTBOX_COALESCE_MAX, metrics=metrics)
+
+metrics.gauge("outbox_queued", lambda: len(outbox), "Replies waiting for a channel rate-limit token")
+metrics.gauge("outbox_sent", lambda: outbox.sent, "Queued replies sent as new messages")
+metrics.gauge("outbox_edited", lambda: outbox.edited, "Queued replies delivered by editing a previous message")
+metrics.gauge("outbox_coalesced", lambda: outbox.coalesced, "Results merged into an existing reply")
+metrics.gauge("outbox_direct", lambda: outbox.direct, "Interaction responses sent immediately")
+metrics.gauge("outbox_errors", lambda: outbox.errors, "Failed reply deliveries")
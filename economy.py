@@ -0,0 +1,411 @@
+# economy.py — In-Memory Economy Store (authoritativ, write-behind)
+# Lädt den Zustand einmal aus dem Storage-Backend, hält alle Profile im
+# Speicher und schreibt geänderte User gebündelt in festen Intervallen zurück.
+# Optional wird jede Mutation sofort ins Journal geschrieben; der Flush ist
+# dann zugleich die Kompaktierung (Journal -> Snapshot).
+#
+# Schreibende Handler nutzen economy.transaction(uid_a, uid_b): pro User ein
+# asyncio.Lock (feste Reihenfolge => keine Deadlocks), alle Änderungen werden
+# gemeinsam als ein Journal-Eintrag übernommen oder bei Fehlern zurückgerollt.
+#
+# Mit cache_capacity > 0 (nur SQLite) liegen nur die zuletzt benutzten Profile
+# im Speicher (profilecache.ProfileCache), der Rest wird bei Bedarf nachgeladen.
+#
+# economy.snapshot() liefert eine unveränderliche Sicht (snapshot.Snapshot) für
+# Leser, die über mehrere awaits oder in einem Thread lesen (z. B. der Flush).
+# Schreiber kopieren ein Profil nur, wenn ein offener Snapshot es enthält.
+
+import time
+import asyncio
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from threading import Lock
+from datetime import datetime
+from typing import Dict, Any, AsyncIterator, Callable, Iterable, List, Optional, Sequence, Set, Tuple
+
+from profilecache import ProfileCache
+from snapshot import Snapshot
+
+
+class Transaction:
+    def __init__(self, economy: "Economy", uids: List[str], op: str):
+        self.op = op
+        self.info: Dict[str, Any] = {}  # Details für den Journal-Eintrag
+        self._profiles = {uid: economy.get(uid) for uid in uids}
+        self._before = {uid: p.copy() for uid, p in self._profiles.items()}
+        for uid, before in self._before.items():
+            economy._freeze(uid, before)
+
+    def __getitem__(self, user_id) -> Dict[str, Any]:
+        return self._profiles[str(user_id)]
+
+    def changed(self) -> Dict[str, Dict[str, Any]]:
+        return {uid: p for uid, p in self._profiles.items() if p != self._before[uid]}
+
+    def rollback(self):
+        # in-place, damit bestehende Referenzen auf das Profil gültig bleiben;
+        # restore() übernimmt das Objekt, _before kann aber in Snapshots liegen
+        for uid, before in self._before.items():
+            self._profiles[uid].restore(before.copy())
+
+
+class Economy:
+    def __init__(
+        self,
+        backend,
+        new_profile: Callable[[], Any],
+        decode: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        migrations: Sequence[Tuple[str, Callable[[Dict[str, Any]], bool]]] = (),
+        journal=None,
+        settle: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        cache_capacity: int = 0,
+    ):
+        self.backend = backend  # storage.JsonBackend / storage.SqliteBackend
+        self.journal = journal  # storage.Journal oder None
+        self._new_profile = new_profile
+        self._decode = decode  # JSON-Dict -> Profil-Objekt (nach den Migrationen)
+        # (Name, step(profile) -> geändert?); Schritt i hebt auf schema_version i + 1
+        self._migrations = list(migrations)
+        self.migration_report: Dict[str, int] = {}
+        self._settle = settle  # settle(uid, profile): Abrechnung beim Lesen (z. B. Job-Einkommen)
+        self.cache_capacity = cache_capacity
+        self.cache: Optional[ProfileCache] = None  # gesetzt, wenn Profile ausgelagert werden
+        self._writing: Set[str] = set()           # User, deren Flush gerade geschrieben wird
+        self._io_lock = Lock()
+        # Flushes strikt nacheinander: ein Worker-Thread, und jeder Flush wartet den
+        # vorherigen ab, bevor er das Journal rotiert (sonst löscht discard_compacted
+        # Einträge, deren Zeilen der laufende Flush noch gar nicht geschrieben hat)
+        self._flush_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="economy-flush")
+        self._inflight: Optional[Tuple[Set[str], Snapshot, Future]] = None
+        # Locks leben nur, solange eine Transaktion sie hält oder darauf wartet
+        self._user_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+        self._dirty: Set[str] = set()
+        self.data: Dict[str, Any] = {"users": {}, "meta": {}}
+        self.loaded = False
+        self.loaded_seq = 0               # journal_seq des geladenen Snapshots
+        self.recovered: Set[str] = set()  # beim Start aus dem Journal nachgespielte User
+        self._listeners: List[Callable[[str, Dict[str, Any]], None]] = []
+        self._snapshots: List[Snapshot] = []
+        self._tx_before: Dict[str, Any] = {}  # übernommener Stand von Usern in laufenden Transaktionen
+
+    # ---- Zustand
+    @property
+    def users(self) -> Dict[str, Dict[str, Any]]:
+        return self.data["users"]
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        return self.data["meta"]
+
+    @property
+    def dirty_count(self) -> int:
+        return len(self._dirty)
+
+    def _empty(self) -> Dict[str, Any]:
+        return {"users": {}, "meta": {"created_at": datetime.utcnow().isoformat(), "schema_version": len(self._migrations)}}
+
+    def load(self):
+        # Liest den Zustand genau einmal ein; danach ist der Speicher maßgeblich
+        # (ausgelagerte Profile: das Backend, bis sie wieder geladen werden).
+        paged = self.cache_capacity > 0 and hasattr(self.backend, "load_user")
+        if self.cache_capacity > 0 and not paged:
+            print(f"[economy] profile paging needs the sqlite backend; keeping all {self.backend.name} profiles in memory")
+        with self._io_lock:
+            data = self.backend.load(users=False) if paged else self.backend.load()
+        self._dirty.clear()
+        if data is None:
+            data = self._empty()
+            self._dirty.add("*")
+        data.setdefault("users", {})
+        data.setdefault("meta", {"created_at": datetime.utcnow().isoformat()})
+        self.data = data
+        self.loaded_seq = int(self.meta.get("journal_seq", 0))
+        self.recovered = set()
+        recovered: Dict[str, Any] = {}
+        if self.journal is not None:
+            # Recovery: Snapshot + Journal-Rest (nach journal_seq) nachspielen
+            replayed = 0
+            for entry in self.journal.replay(self.loaded_seq):
+                recovered.update(entry.get("users", {}))
+                replayed += 1
+            self.recovered = set(recovered)
+            self._dirty |= self.recovered
+            if replayed:
+                print(f"[economy] replayed {replayed} journal entries")
+            self.journal.open()
+        if paged:
+            self.cache = ProfileCache(self.backend, self._decode, self.cache_capacity, self._pinned)
+            self._migrate(recovered)
+            self.data["users"] = self.cache
+            for uid, prof in recovered.items():
+                self.cache[uid] = self._decode(prof)
+        else:
+            self.users.update(recovered)
+            self._migrate({})
+            if self._decode is not None:
+                users = self.users
+                for uid, prof in users.items():
+                    users[uid] = self._decode(prof)
+        self.flush()
+        self.loaded = True
+
+    def _migrate(self, recovered: Dict[str, Any]):
+        # Ausstehende Schema-Migrationen einmal beim Laden, in einem Durchlauf über
+        # alle User; danach ist jedes Profil im aktuellen Format (kein Upgrade pro Zugriff)
+        self.migration_report = {}
+        version = int(self.meta.get("schema_version", 0))
+        pending = self._migrations[version:]
+        if not pending:
+            return
+        t0 = time.perf_counter()
+        counts = {name: 0 for name, _ in pending}
+
+        def apply(prof: Dict[str, Any]) -> bool:
+            changed = False
+            for name, step in pending:
+                if step(prof):
+                    counts[name] += 1
+                    changed = True
+            return changed
+
+        total = 0
+        if self.cache is None:
+            for uid, prof in self.users.items():
+                total += 1
+                if apply(prof):
+                    self._dirty.add(uid)
+        else:
+            # ausgelagerte Profile direkt im Backend migrieren, blockweise zurückschreiben
+            batch: Dict[str, Any] = {}
+            for uid, prof in self.backend.iter_users():
+                total += 1
+                if apply(prof):
+                    batch[uid] = prof
+                if len(batch) >= 1000:
+                    self._write_rows(batch)
+                    batch = {}
+            self._write_rows(batch)
+            for prof in recovered.values():  # werden danach ohnehin als dirty übernommen
+                apply(prof)
+        self.meta["schema_version"] = len(self._migrations)
+        if self.cache is not None:
+            self._write_rows({})  # Meta (schema_version) sofort festschreiben
+        self.migration_report = counts
+        steps = ", ".join(f"{name}: {n}" for name, n in counts.items())
+        print(f"[economy] schema {version} -> {len(self._migrations)} over {total} users "
+              f"in {time.perf_counter() - t0:.2f}s ({steps})")
+
+    # ---- Profile
+    def get(self, user_id: int) -> Dict[str, Any]:
+        uid = str(user_id)
+        prof = self.users.get(uid)
+        if prof is None:
+            prof = self._new_profile()
+            self.users[uid] = prof
+            self.record("create", uid)
+        elif self._settle:
+            self.touch(uid)
+            self._settle(uid, prof)
+        return prof
+
+    def put(self, user_id: int, profile: Dict[str, Any], op: str = "set", **info):
+        self.commit(op, {user_id: profile}, **info)
+
+    def commit(self, op: str, profiles: Dict[int, Dict[str, Any]], **info):
+        # Mehrere Profile als eine Änderung übernehmen (ein Journal-Eintrag)
+        for user_id, profile in profiles.items():
+            self.touch(user_id)
+            self.users[str(user_id)] = profile
+        self.record(op, *profiles.keys(), **info)
+
+    def record(self, op: str, *user_ids, **info):
+        # In-place geänderte Profile journalen und als dirty markieren
+        uids = [str(u) for u in user_ids]
+        if self.journal is not None:
+            entry = {"op": op, "ts": int(time.time()), "users": {u: self.users[u] for u in uids}}
+            if info:
+                entry["info"] = info
+            self.journal.append(entry)
+        self._dirty.update(uids)
+        for fn in self._listeners:
+            for uid in uids:
+                fn(uid, self.users[uid])
+
+    def add_listener(self, fn: Callable[[str, Dict[str, Any]], None]):
+        # fn(uid, profile) wird nach jeder übernommenen Änderung aufgerufen
+        self._listeners.append(fn)
+
+    def mark_dirty(self, *user_ids):
+        for user_id in user_ids:
+            self._dirty.add(str(user_id))
+
+    # ---- Snapshots (Copy-on-Write)
+    def snapshot(self, user_ids: Optional[Iterable] = None) -> Snapshot:
+        # Sicht auf den übernommenen Stand (ohne halbfertige Transaktionen);
+        # mit close() bzw. als Context-Manager wieder freigeben
+        if user_ids is None:
+            uids = list(self.users.keys())
+        else:
+            uids = [str(u) for u in user_ids]
+        snap = Snapshot(self.users, dict(self.meta), uids, self._peek, self._snapshots.remove)
+        for uid, before in self._tx_before.items():
+            if snap._wants(uid):
+                snap._freeze(uid, before)
+        self._snapshots.append(snap)
+        return snap
+
+    def _peek(self, uid: str):
+        # aus Worker-Threads: nie nachladen (ProfileCache ist nicht thread-sicher)
+        return self.users.get(uid) if self.cache is None else self.cache.peek(uid)
+
+    def _freeze(self, uid: str, committed):
+        for snap in self._snapshots:
+            if snap._wants(uid):
+                snap._freeze(uid, committed)
+
+    def touch(self, user_id):
+        # vor jeder In-place-Änderung außerhalb einer Transaktion aufrufen:
+        # offene Snapshots behalten den bisherigen Stand. (Das Wegräumen
+        # abgelaufener Effekte in effect_active ist keine Änderung in diesem Sinn.)
+        if not self._snapshots:
+            return
+        uid = str(user_id)
+        if not any(snap._wants(uid) for snap in self._snapshots):
+            return
+        committed = self._tx_before.get(uid)
+        if committed is None:
+            prof = self.users.get(uid)
+            if prof is None:
+                return
+            committed = prof.copy()
+        self._freeze(uid, committed)
+
+    # ---- Transaktionen
+    def _lock_for(self, uid: str) -> asyncio.Lock:
+        lock = self._user_locks.get(uid)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._user_locks[uid] = lock
+        return lock
+
+    def is_locked(self, user_id) -> bool:
+        lock = self._user_locks.get(str(user_id))
+        return lock is not None and lock.locked()
+
+    @asynccontextmanager
+    async def transaction(self, *user_ids, op: str = "tx") -> AsyncIterator[Transaction]:
+        uids = sorted({str(u) for u in user_ids})
+        locks = [self._lock_for(uid) for uid in uids]
+        acquired: List[asyncio.Lock] = []
+        try:
+            for lock in locks:
+                await lock.acquire()
+                acquired.append(lock)
+            tx = Transaction(self, uids, op)
+            self._tx_before.update(tx._before)
+            try:
+                yield tx
+            except BaseException:
+                tx.rollback()
+                raise
+            changed = tx.changed()
+            if changed:
+                self.record(tx.op, *changed.keys(), **tx.info)
+        finally:
+            if len(acquired) == len(locks):
+                for uid in uids:
+                    self._tx_before.pop(uid, None)
+            for lock in reversed(acquired):
+                lock.release()
+
+    # ---- Auslagern (ProfileCache)
+    def _pinned(self, uid: str) -> bool:
+        # nicht verdrängen: ungeschriebene Änderungen (der Flusher schreibt sie),
+        # laufende Transaktion oder Flush, der den User gerade schreibt
+        return uid in self._dirty or self.is_locked(uid) or uid in self._writing
+
+    def _write_rows(self, profiles: Dict[str, Any]):
+        self._write(self.backend.prepare({"users": profiles, "meta": self.meta}, set(profiles)))
+
+    # ---- Write-Behind
+    def _snapshot(self) -> Tuple[Set[str], Snapshot]:
+        # Auf dem Event-Loop nur die Sicht anlegen; serialisiert wird in _flush_write
+        # (ggf. im Worker-Thread); Handler ändern derweil weiter, betroffene Profile
+        # werden dafür einmal kopiert.
+        dirty, self._dirty = self._dirty, set()
+        if self.journal is not None:
+            self.meta["journal_seq"] = self.journal.rotate()
+        if self.cache is not None:
+            self._writing = dirty
+        if self.backend.partial and "*" not in dirty:
+            return dirty, self.snapshot(dirty)
+        return dirty, self.snapshot()
+
+    def _flush_write(self, dirty: Set[str], snap: Snapshot):
+        self._write(self.backend.prepare({"users": snap.export(), "meta": snap.meta}, dirty))
+
+    def _compacted(self):
+        if self.journal is not None:
+            self.journal.discard_compacted()
+
+    def _write(self, payload):
+        with self._io_lock:
+            self.backend.write(payload)
+
+    def _finish(self, job: Tuple[Set[str], Snapshot, Future]) -> Optional[BaseException]:
+        # Ergebnis eines Flushes genau einmal übernehmen (vom Flush selbst oder von
+        # einem nachfolgenden, der auf ihn gewartet hat, z. B. save_data beim Restart)
+        if self._inflight is not job:
+            return None
+        self._inflight = None
+        dirty, snap, fut = job
+        snap.close()
+        self._writing = set()
+        if self.cache is not None:
+            self.cache.trim()  # jetzt saubere Profile wieder verdrängbar
+        error = fut.exception()
+        if error is not None:
+            self._dirty |= dirty  # nächster Durchlauf versucht es erneut
+            return error
+        self._compacted()
+        return None
+
+    def _start(self) -> Tuple[Set[str], Snapshot, Future]:
+        dirty, snap = self._snapshot()
+        job = (dirty, snap, self._flush_pool.submit(self._flush_write, dirty, snap))
+        self._inflight = job
+        return job
+
+    def flush(self) -> bool:
+        # Synchron schreiben, falls etwas geändert wurde (z. B. beim Shutdown/Restart);
+        # ein noch laufender flush_async wird vorher abgewartet und abgeschlossen
+        job = self._inflight
+        if job is not None:
+            job[2].exception()  # blockiert, bis der Worker fertig ist
+            self._finish(job)
+        if not self._dirty:
+            return False
+        job = self._start()
+        job[2].exception()
+        error = self._finish(job)
+        if error is not None:
+            raise error
+        return True
+
+    async def flush_async(self) -> bool:
+        # Wie flush(), aber der eigentliche Schreibvorgang läuft im Flush-Thread.
+        # Wird das Warten abgebrochen, schreibt der Thread trotzdem zu Ende; der
+        # nächste Flush übernimmt dann das Ergebnis.
+        while self._inflight is not None:
+            job = self._inflight
+            await asyncio.wait([asyncio.wrap_future(job[2])])
+            self._finish(job)
+        if not self._dirty:
+            return False
+        job = self._start()
+        await asyncio.wait([asyncio.wrap_future(job[2])])
+        error = self._finish(job)
+        if error is not None:
+            raise error
+        return True
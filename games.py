@@ -0,0 +1,149 @@
+# games.py — Spielauflösung (ohne Discord), geteilt von Bot und Simulator
+# Einzelrunden für die Commands, NumPy-Batches (falls installiert) für
+# Multi-Spin und den Offline-Simulator (simulate.py). Balancing-Werte stehen
+# hier, damit beide Seiten garantiert mit denselben Quoten rechnen.
+
+import bisect
+import random
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional, nur für schnelle Batches
+    np = None
+
+
+# =========================
+# BALANCING
+# =========================
+SLOTS_SYMBOLS = ["🍒", "🍋", "⭐", "🍇", "💎"]
+SLOTS_JACKPOT_MULT = 5
+SLOTS_TWOMATCH_MULT = 2
+
+ROULETTE_CHOICES = {"red": "Red", "black": "Black", "odd": "Odd", "even": "Even"}
+
+BLACKJACK_CARD_MIN = 1
+BLACKJACK_CARD_MAX = 11
+
+ROB_SUCCESS_CHANCE = 0.5
+ROB_LOOT_MIN_PCT = 0.10
+ROB_LOOT_MAX_PCT = 0.30
+ROB_FAIL_FINE_MIN = 50
+ROB_FAIL_FINE_MAX = 150
+
+LOTTO_TICKET_PRICE = 100
+LOTTO_WIN_PCT = 0.70  # 70% des Pots an Gewinner
+
+
+# =========================
+# SLOTS
+# =========================
+def slots_spin(symbols: Sequence[str], luck_pct: int, jackpot_mult: int, twomatch_mult: int) -> Tuple[List[str], int]:
+    rolls = [random.choice(symbols) for _ in range(3)]
+
+    # Mit Glück: mit kleiner Wahrscheinlichkeit mach ein 2er zu 3er Match
+    if luck_pct > 0 and random.random() < (luck_pct / 100.0):
+        if rolls[0] == rolls[1] or rolls[1] == rolls[2] or rolls[0] == rolls[2]:
+            common = rolls[1] if rolls[0] == rolls[1] else (rolls[2] if rolls[1] == rolls[2] else rolls[0])
+            rolls = [common, common, common]
+
+    win_mult = 0
+    if rolls[0] == rolls[1] == rolls[2]:
+        win_mult = jackpot_mult
+    elif rolls[0] == rolls[1] or rolls[1] == rolls[2] or rolls[0] == rolls[2]:
+        win_mult = twomatch_mult
+    return rolls, win_mult
+
+
+@lru_cache(maxsize=64)
+def slots_payout_table(n_symbols: int, luck_pct: int, jackpot_mult: int, twomatch_mult: int) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    # Exakte Verteilung von slots_spin: (kumulierte Wahrscheinlichkeiten, Multiplikatoren)
+    n = float(n_symbols)
+    p_triple = 1.0 / (n * n)
+    p_pair = 3.0 * (n - 1.0) / (n * n)
+    luck = min(max(luck_pct, 0), 100) / 100.0
+    p_jackpot = p_triple + p_pair * luck  # Luck-Nudge macht aus 2er ein 3er
+    p_small = p_pair * (1.0 - luck)
+    return (p_jackpot, p_jackpot + p_small), (jackpot_mult, twomatch_mult, 0)
+
+
+def slots_mults(rng, n: int, table: Tuple[Tuple[float, ...], Tuple[int, ...]]):
+    # NumPy: Multiplikator je Spin als Array
+    thresholds, mults = table
+    return np.asarray(mults)[np.searchsorted(thresholds, rng.random(n), side="right")]
+
+
+def slots_batch(spins: int, table: Tuple[Tuple[float, ...], Tuple[int, ...]]) -> List[int]:
+    # Multiplikatoren für `spins` Spins auf einmal
+    if np is not None:
+        return slots_mults(np.random.default_rng(), spins, table).tolist()
+    thresholds, mults = table
+    out = []
+    for _ in range(spins):
+        u = random.random()
+        out.append(mults[0] if u < thresholds[0] else (mults[1] if u < thresholds[1] else mults[2]))
+    return out
+
+
+# =========================
+# ROULETTE / BLACKJACK
+# =========================
+def roulette_spin() -> str:
+    return random.choice(list(ROULETTE_CHOICES.values()))
+
+
+def roulette_wins(rng, n: int, choice: str):
+    # NumPy: True, wo das Rad auf der gesetzten Option landet
+    outcomes = list(ROULETTE_CHOICES.values())
+    return rng.integers(len(outcomes), size=n) == outcomes.index(ROULETTE_CHOICES[choice])
+
+
+def blackjack_draw() -> Tuple[int, int]:
+    return random.randint(BLACKJACK_CARD_MIN, BLACKJACK_CARD_MAX), random.randint(BLACKJACK_CARD_MIN, BLACKJACK_CARD_MAX)
+
+
+def blackjack_draws(rng, n: int):
+    # NumPy: (Spielerkarten, Dealerkarten)
+    cards = rng.integers(BLACKJACK_CARD_MIN, BLACKJACK_CARD_MAX + 1, size=(2, n))
+    return cards[0], cards[1]
+
+
+# =========================
+# ROB
+# =========================
+def rob_attempt(victim_wallet: int, attacker_wallet: int) -> Tuple[bool, int, int]:
+    # (Erfolg, Beute, Strafe)
+    if random.random() < ROB_SUCCESS_CHANCE:
+        pct = random.uniform(ROB_LOOT_MIN_PCT, ROB_LOOT_MAX_PCT)
+        return True, max(1, int(victim_wallet * pct)), 0
+    fine = random.randint(ROB_FAIL_FINE_MIN, ROB_FAIL_FINE_MAX)
+    return False, 0, min(fine, attacker_wallet)
+
+
+def rob_attempts(rng, n: int, victim_wallet: int, attacker_wallet: int):
+    # NumPy-Variante von rob_attempt für feste Wallets
+    success = rng.random(n) < ROB_SUCCESS_CHANCE
+    pct = rng.uniform(ROB_LOOT_MIN_PCT, ROB_LOOT_MAX_PCT, size=n)
+    loot = np.where(success, np.maximum(1, (victim_wallet * pct).astype(np.int64)), 0)
+    fine = rng.integers(ROB_FAIL_FINE_MIN, ROB_FAIL_FINE_MAX + 1, size=n)
+    fine = np.where(success, 0, np.minimum(fine, attacker_wallet))
+    return success, loot, fine
+
+
+# =========================
+# LOTTERY
+# =========================
+def draw_lottery_winner(tickets: Dict[str, int]) -> str:
+    # fair pro Ticket: kumulierte Gewichte + binäre Suche
+    uids = list(tickets)
+    cumulative = list(accumulate(tickets[u] for u in uids))
+    pick = random.randrange(cumulative[-1])
+    return uids[bisect.bisect_right(cumulative, pick)]
+
+
+def lottery_winners(rng, n: int, counts: Sequence[int]):
+    # NumPy: Index des Gewinners je Ziehung, gleiche Gewichtung wie draw_lottery_winner
+    cumulative = np.cumsum(counts)
+    return np.searchsorted(cumulative, rng.integers(cumulative[-1], size=n), side="right")
@@ -0,0 +1,154 @@
+# leaderboard.py — Inkrementeller Rang-Index (indexierbare Skip-List)
+# Wird bei jeder Wallet/Bank-Änderung aktualisiert; Top-N in O(log U + N),
+# Rang eines Users in O(log U). Sortierung: Net Worth absteigend, dann User-ID.
+
+import random
+from typing import Dict, List, Optional, Tuple
+
+_MAX_LEVEL = 32
+
+
+class _Node:
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key, level: int):
+        self.key = key
+        self.next: List[Optional["_Node"]] = [None] * level
+        self.width: List[int] = [1] * level
+
+
+class RankIndex:
+    def __init__(self):
+        self._head = _Node(None, _MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+        self._scores: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, uid: str) -> bool:
+        return uid in self._scores
+
+    @staticmethod
+    def _key(uid: str, score: int) -> Tuple[int, str]:
+        return (-score, uid)
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < _MAX_LEVEL and random.random() < 0.5:
+            level += 1
+        return level
+
+    def _path(self, key) -> Tuple[List[_Node], List[int]]:
+        # Vorgänger je Ebene + deren Position (0 = Kopf, 1 = erstes Element)
+        update = [self._head] * _MAX_LEVEL
+        pos = [0] * _MAX_LEVEL
+        node, p = self._head, 0
+        for lvl in range(self._level - 1, -1, -1):
+            while node.next[lvl] is not None and node.next[lvl].key < key:
+                p += node.width[lvl]
+                node = node.next[lvl]
+            update[lvl] = node
+            pos[lvl] = p
+        return update, pos
+
+    def _insert(self, key):
+        update, pos = self._path(key)
+        level = self._random_level()
+        if level > self._level:
+            for lvl in range(self._level, level):
+                update[lvl] = self._head
+                pos[lvl] = 0
+                self._head.width[lvl] = self._size + 1
+            self._level = level
+        node = _Node(key, level)
+        rank = pos[0] + 1
+        for lvl in range(level):
+            prev = update[lvl]
+            node.next[lvl] = prev.next[lvl]
+            prev.next[lvl] = node
+            # Breiten aufteilen: prev -> node -> alter Nachfolger
+            node.width[lvl] = prev.width[lvl] - (rank - pos[lvl]) + 1
+            prev.width[lvl] = rank - pos[lvl]
+        for lvl in range(level, self._level):
+            update[lvl].width[lvl] += 1
+        self._size += 1
+
+    def _remove(self, key):
+        update, _ = self._path(key)
+        node = update[0].next[0]
+        if node is None or node.key != key:
+            return
+        for lvl in range(self._level):
+            prev = update[lvl]
+            if prev.next[lvl] is node:
+                prev.width[lvl] += node.width[lvl] - 1
+                prev.next[lvl] = node.next[lvl]
+            else:
+                prev.width[lvl] -= 1
+        while self._level > 1 and self._head.next[self._level - 1] is None:
+            self._level -= 1
+        self._size -= 1
+
+    # ---- öffentliche API
+    def rebuild(self, scores: Dict[str, int]):
+        # Massenaufbau beim Start: einmal sortieren, dann in O(U) verketten
+        self.__init__()
+        self._scores = dict(scores)
+        keys = sorted(self._key(uid, score) for uid, score in self._scores.items())
+        last = [self._head] * _MAX_LEVEL
+        last_pos = [0] * _MAX_LEVEL
+        for pos, key in enumerate(keys, start=1):
+            level = self._random_level()
+            node = _Node(key, level)
+            for lvl in range(level):
+                last[lvl].next[lvl] = node
+                last[lvl].width[lvl] = pos - last_pos[lvl]
+                last[lvl] = node
+                last_pos[lvl] = pos
+            self._level = max(self._level, level)
+        for lvl in range(_MAX_LEVEL):
+            last[lvl].width[lvl] = len(keys) + 1 - last_pos[lvl]
+        self._size = len(keys)
+
+    def update(self, uid: str, score: int):
+        old = self._scores.get(uid)
+        if old == score:
+            return
+        if old is not None:
+            self._remove(self._key(uid, old))
+        self._scores[uid] = score
+        self._insert(self._key(uid, score))
+
+    def remove(self, uid: str):
+        old = self._scores.pop(uid, None)
+        if old is not None:
+            self._remove(self._key(uid, old))
+
+    def score(self, uid: str) -> Optional[int]:
+        return self._scores.get(uid)
+
+    def rank(self, uid: str) -> Optional[int]:
+        # 1-basierter Rang oder None
+        score = self._scores.get(uid)
+        if score is None:
+            return None
+        _, pos = self._path(self._key(uid, score))
+        return pos[0] + 1
+
+    def page(self, offset: int, limit: int) -> List[Tuple[str, int]]:
+        # Einträge [offset, offset + limit) als (uid, score)
+        out: List[Tuple[str, int]] = []
+        if offset < 0 or offset >= self._size or limit <= 0:
+            return out
+        node, p = self._head, 0
+        for lvl in range(self._level - 1, -1, -1):
+            while node.next[lvl] is not None and p + node.width[lvl] <= offset + 1:
+                p += node.width[lvl]
+                node = node.next[lvl]
+        while node is not None and len(out) < limit:
+            neg, uid = node.key
+            out.append((uid, -neg))
+            node = node.next[0]
+        return out
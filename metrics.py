@@ -0,0 +1,302 @@
+# metrics.py — Laufzeit-Metriken (Histogramme, Zähler, Gauges)
+# Pro Command: Gesamtlatenz + Anteil Persistenz vs. Discord-API (über eine
+# ContextVar dem laufenden Command zugeordnet; über die outbox gequeuete Antworten
+# zählen bis zur Zustellung mit, siehe hold/release). Export im Prometheus-Textformat
+# über einen kleinen HTTP-Server auf localhost, Kurzfassung für /metrics.
+
+import time
+import bisect
+import asyncio
+import functools
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PHASES = ("persistence", "discord")
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # letzter Eintrag = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        # Schätzung per linearer Interpolation innerhalb des Buckets
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if seen + n >= target and n:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                if i >= len(self.buckets):
+                    return lower
+                return lower + (self.buckets[i] - lower) * (target - seen) / n
+            seen += n
+        return self.buckets[-1]
+
+
+class _CommandTimer:
+    __slots__ = ("name", "start", "phases", "pending", "ended", "done")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.pending = 0     # noch nicht zugestellte Antworten (outbox)
+        self.ended = False   # Handler fertig
+        self.done = False    # gemessen (Handler fertig und alles zugestellt)
+
+
+# Wird von Tasks geerbt (z. B. on_command_error), daher mutables Objekt + done-Flag
+_current: "contextvars.ContextVar[Optional[_CommandTimer]]" = contextvars.ContextVar("metrics_command", default=None)
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _fmt_labels(labels: Labels, extra: str = "") -> str:
+    parts = []
+    for k, v in labels:
+        v = v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{k}="{v}"')
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Metrics:
+    def __init__(self, prefix: str = "bot", buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = buckets
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._gauges: Dict[str, Callable[[], float]] = {}
+        self._help: Dict[str, str] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    # ---- Grundbausteine
+    def observe(self, name: str, value: float, **labels):
+        family = self._histograms.setdefault(name, {})
+        key = _labels(labels)
+        hist = family.get(key)
+        if hist is None:
+            hist = family[key] = Histogram(self.buckets)
+        hist.observe(value)
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        family = self._counters.setdefault(name, {})
+        key = _labels(labels)
+        family[key] = family.get(key, 0) + amount
+
+    def gauge(self, name: str, fn: Callable[[], float], help: str = ""):
+        # Wert wird erst beim Export abgefragt
+        self._gauges[name] = fn
+        if help:
+            self._help[name] = help
+
+    def describe(self, name: str, help: str):
+        self._help[name] = help
+
+    def histogram(self, name: str, **labels) -> Optional[Histogram]:
+        return self._histograms.get(name, {}).get(_labels(labels))
+
+    def counter(self, name: str, **labels) -> float:
+        return self._counters.get(name, {}).get(_labels(labels), 0)
+
+    # ---- Commands
+    def command_started(self, name: str):
+        _current.set(_CommandTimer(name))
+
+    def command_finished(self) -> Optional[str]:
+        # idempotent: after_invoke und Fehler-Handler können beide aufrufen
+        timer = _current.get()
+        if timer is None or timer.ended:
+            return None
+        timer.ended = True
+        if timer.pending == 0:
+            self._observe_command(timer)
+        return timer.name
+
+    def _observe_command(self, timer: _CommandTimer):
+        timer.done = True
+        self.observe("command_seconds", time.perf_counter() - timer.start, command=timer.name)
+        for phase in PHASES:
+            self.observe("command_phase_seconds", timer.phases.get(phase, 0.0), command=timer.name, phase=phase)
+
+    def hold(self) -> Optional[_CommandTimer]:
+        # Antwort wird erst nach dem Handler zugestellt (outbox): der Command gilt
+        # als fertig, wenn alle gehaltenen Zustellungen per release() gemeldet sind
+        timer = _current.get()
+        if timer is None or timer.ended:
+            return None
+        timer.pending += 1
+        return timer
+
+    def release(self, timer: _CommandTimer, discord_seconds: float):
+        timer.phases["discord"] = timer.phases.get("discord", 0.0) + discord_seconds
+        timer.pending -= 1
+        if timer.ended and timer.pending == 0:
+            self._observe_command(timer)
+
+    def detach(self):
+        # für Hintergrund-Tasks, die sonst den Timer des startenden Commands erben
+        _current.set(None)
+
+    def current_command(self) -> Optional[str]:
+        timer = _current.get()
+        return timer.name if timer is not None else None
+
+    def _add_phase(self, kind: str, seconds: float):
+        self.observe(f"{kind}_seconds", seconds)
+        timer = _current.get()
+        if timer is not None and not timer.done:
+            timer.phases[kind] = timer.phases.get(kind, 0.0) + seconds
+
+    @contextmanager
+    def track(self, kind: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add_phase(kind, time.perf_counter() - t0)
+
+    def instrument(self, obj: Any, attr: str, kind: str):
+        # Methode eines Objekts (sync oder async) mit Zeitmessung umhüllen
+        fn = getattr(obj, attr)
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                t0 = time.perf_counter()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    self._add_phase(kind, time.perf_counter() - t0)
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                t0 = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self._add_phase(kind, time.perf_counter() - t0)
+        setattr(obj, attr, wrapper)
+
+    # ---- Export
+    def render(self) -> str:
+        out: List[str] = []
+        for name, family in sorted(self._histograms.items()):
+            full = f"{self.prefix}_{name}"
+            if name in self._help:
+                out.append(f"# HELP {full} {self._help[name]}")
+            out.append(f"# TYPE {full} histogram")
+            for labels, hist in sorted(family.items()):
+                cumulative = 0
+                for bound, n in zip(self.buckets, hist.counts):
+                    cumulative += n
+                    le = _fmt_labels(labels, 'le="%s"' % bound)
+                    out.append(f"{full}_bucket{le} {cumulative}")
+                le = _fmt_labels(labels, 'le="+Inf"')
+                out.append(f"{full}_bucket{le} {hist.count}")
+                out.append(f"{full}_sum{_fmt_labels(labels)} {hist.sum}")
+                out.append(f"{full}_count{_fmt_labels(labels)} {hist.count}")
+        for name, family in sorted(self._counters.items()):
+            full = f"{self.prefix}_{name}"
+            if name in self._help:
+                out.append(f"# HELP {full} {self._help[name]}")
+            out.append(f"# TYPE {full} counter")
+            for labels, value in sorted(family.items()):
+                out.append(f"{full}{_fmt_labels(labels)} {value}")
+        for name, fn in sorted(self._gauges.items()):
+            full = f"{self.prefix}_{name}"
+            try:
+                value = float(fn())
+            except Exception:
+                continue
+            if name in self._help:
+                out.append(f"# HELP {full} {self._help[name]}")
+            out.append(f"# TYPE {full} gauge")
+            out.append(f"{full} {value}")
+        return "\n".join(out) + "\n"
+
+    def summary(self, limit: int = 15) -> str:
+        # Kurzfassung für /metrics: langsamste/häufigste Commands zuerst
+        commands = self._histograms.get("command_seconds", {})
+        phases = self._histograms.get("command_phase_seconds", {})
+        errors: Dict[str, float] = {}
+        for labels, value in self._counters.get("command_errors_total", {}).items():
+            name = dict(labels).get("command", "?")
+            errors[name] = errors.get(name, 0) + value
+        lines = [f"{'command':<16}{'n':>7}{'p50':>8}{'p95':>8}{'p99':>8}{'db':>7}{'api':>7}{'err':>5}"]
+        rows = sorted(commands.items(), key=lambda kv: kv[1].count, reverse=True)[:limit]
+        for labels, hist in rows:
+            name = dict(labels)["command"]
+            avg = {}
+            for phase in PHASES:
+                ph = phases.get(_labels({"command": name, "phase": phase}))
+                avg[phase] = (ph.sum / ph.count * 1000) if ph and ph.count else 0.0
+            lines.append(
+                f"{name[:15]:<16}{hist.count:>7}{hist.quantile(0.5) * 1000:>8.1f}{hist.quantile(0.95) * 1000:>8.1f}"
+                f"{hist.quantile(0.99) * 1000:>8.1f}{avg['persistence']:>7.1f}{avg['discord']:>7.1f}{int(errors.get(name, 0)):>5}"
+            )
+        if not rows:
+            lines.append("(no commands yet)")
+        lines.append("times in ms; db = persistence, api = Discord API (avg per call)")
+        loop = self.histogram("economy_loop_seconds")
+        if loop and loop.count:
+            users = self.counter("economy_loop_users_total")
+            lines.append(
+                f"economy_loop: {loop.count} passes, avg {loop.sum / loop.count * 1000:.1f} ms, "
+                f"p95 {loop.quantile(0.95) * 1000:.1f} ms, {int(users)} users touched"
+            )
+        flush = self.histogram("flush_seconds")
+        if flush and flush.count:
+            lines.append(f"flush: {flush.count} writes, avg {flush.sum / flush.count * 1000:.1f} ms")
+        for name, fn in sorted(self._gauges.items()):
+            try:
+                lines.append(f"{name}: {fn():g}")
+            except Exception:
+                pass
+        return "\n".join(lines)
+
+    # ---- HTTP-Endpunkt (nur localhost)
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request = await asyncio.wait_for(reader.readline(), 5)
+            while True:
+                line = await asyncio.wait_for(reader.readline(), 5)
+                if line in (b"\r\n", b"\n", b""):
+                    break
+            parts = request.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] in ("/", "/metrics"):
+                status, body = "200 OK", self.render().encode()
+            else:
+                status, body = "404 Not Found", b"not found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        except Exception:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str, port: int) -> bool:
+        if self._server is not None:
+            return False
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return True
@@ -0,0 +1,63 @@
+# namecache.py — TTL/LRU-Cache für Member-Anzeigenamen
+# Gefüttert von on_member_update/join/remove; Fehlzugriffe werden vom Aufrufer
+# gesammelt und in einem Rutsch (query_members) aufgelöst.
+
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+_MISSING = object()
+
+
+class NameCache:
+    def __init__(self, capacity: int = 5000, ttl: float = 3600.0, negative_ttl: float = 300.0):
+        self.capacity = capacity
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl  # "nicht (mehr) auf dem Server" kürzer merken
+        self._entries: "OrderedDict[Tuple[int, int], Tuple[Optional[str], float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, guild_id: int, user_id: int):
+        # Name, None (bekannt: kein Member) oder _MISSING
+        key = (guild_id, user_id)
+        entry = self._entries.get(key)
+        if entry is None or entry[1] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return _MISSING
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, guild_id: int, user_id: int, name: Optional[str]):
+        ttl = self.ttl if name is not None else self.negative_ttl
+        key = (guild_id, user_id)
+        self._entries[key] = (name, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def remove(self, guild_id: int, user_id: int):
+        self._entries.pop((guild_id, user_id), None)
+
+    def lookup(self, guild_id: int, user_ids: Iterable[int]) -> Tuple[Dict[int, Optional[str]], list]:
+        # (gefundene Namen, fehlende IDs)
+        found: Dict[int, Optional[str]] = {}
+        missing = []
+        for uid in user_ids:
+            name = self.get(guild_id, uid)
+            if name is _MISSING:
+                missing.append(uid)
+            else:
+                found[uid] = name
+        return found, missing
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -0,0 +1,223 @@
+# outbox.py — Ausgehende Antworten mit Rate-Limit pro Channel und Coalescing
+# Prefix-Antworten laufen über eine Queue pro Channel mit Token-Bucket (Discords
+# Channel-Limit), statt in discord.py's serielles 429-Backoff zu laufen.
+# Schnell aufeinanderfolgende Ergebnisse desselben Users mit gleichem key
+# (z. B. "slots") werden zu einer Nachricht zusammengefasst bzw. per Edit
+# nachgetragen. Interaction-Antworten (3-s-Frist, eigener Webhook-Bucket)
+# gehen sofort und an der Queue vorbei raus.
+
+import time
+import asyncio
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+import discord
+from discord.ext import commands
+
+MESSAGE_LIMIT = 2000
+_SEPARATOR = "\n┄┄┄┄┄┄┄┄\n"
+
+
+class Reply:
+    # Eine (ggf. zusammengefasste) Antwort; message ist gesetzt, sobald sie gesendet wurde
+    def __init__(self, ctx: commands.Context, key: Optional[str], content: Optional[str],
+                 embed: Optional[discord.Embed] = None):
+        self.ctx = ctx
+        self.channel_id = ctx.channel.id
+        self.user_id = ctx.author.id
+        self.key = key
+        self.parts: List[str] = [content] if content is not None else []
+        self.embed = embed
+        self.message: Optional[discord.Message] = None
+        self.queued = False
+        self.timers: List = []  # metrics-Timer der Commands, deren Ergebnis hier drinsteckt
+        self.sent_at = 0.0
+        self.error: Optional[Exception] = None
+        self._sent = asyncio.Event()
+
+    def render(self, max_parts: int) -> Optional[str]:
+        if not self.parts:
+            return None
+        parts = self.parts[-max_parts:]
+        text = _SEPARATOR.join(parts)
+        # älteste Ergebnisse zuerst opfern, wenn das Nachrichtenlimit überschritten wird
+        while len(parts) > 1 and len(text) > MESSAGE_LIMIT:
+            parts = parts[1:]
+            text = _SEPARATOR.join(parts)
+        return text[:MESSAGE_LIMIT]
+
+    def _delivered(self, message: discord.Message):
+        self.message = message
+        self.sent_at = time.monotonic()
+        self._sent.set()
+
+    def _failed(self, error: Exception):
+        self.error = error
+        self._sent.set()
+
+    async def wait(self) -> discord.Message:
+        # wartet auf die erste Zustellung (nur nötig, wenn man die Message braucht)
+        await self._sent.wait()
+        if self.message is None:
+            raise self.error
+        return self.message
+
+
+class _Channel:
+    def __init__(self, rate: int):
+        self.queue: Deque[Reply] = deque()
+        self.tokens = float(rate)
+        self.refilled = time.monotonic()
+        self.active = self.refilled
+        self.worker: Optional[asyncio.Task] = None
+        self.last: Optional[Reply] = None  # zuletzt zugestellte Antwort (Edit-Ziel)
+
+
+class Outbox:
+    def __init__(self, rate: int = 5, per: float = 5.0, coalesce_window: float = 10.0, coalesce_max: int = 5,
+                 metrics=None):
+        self.rate = rate                    # Nachrichten (inkl. Edits) pro Channel ...
+        self.per = per                      # ... je `per` Sekunden
+        self.coalesce_window = coalesce_window
+        self.coalesce_max = coalesce_max    # so viele Ergebnisse zeigt eine Sammelnachricht
+        self._channels: Dict[int, _Channel] = {}
+        # metrics.Metrics: Zustellzeit als discord-Phase dem auslösenden Command zurechnen
+        self.metrics = metrics
+        self._pruned = time.monotonic()
+        self.sent = 0
+        self.edited = 0
+        self.coalesced = 0
+        self.direct = 0
+        self.errors = 0
+
+    def __len__(self) -> int:
+        return sum(len(ch.queue) for ch in self._channels.values())
+
+    async def reply(self, ctx: commands.Context, content: Optional[str] = None, *,
+                    key: Optional[str] = None, embed: Optional[discord.Embed] = None) -> Reply:
+        # Blockiert bei Prefix-Commands nicht bis zur Zustellung (Transaktions-Locks
+        # sollen nicht auf Rate-Limits warten); Reply.wait() liefert die Message.
+        if ctx.interaction is not None:
+            reply = Reply(ctx, key, content, embed)
+            reply._delivered(await ctx.reply(content, embed=embed, mention_author=False))
+            self.direct += 1
+            return reply
+        ch = self._channel(ctx.channel.id)
+        if key is not None and content is not None and embed is None:
+            reply = self._coalesce_target(ch, ctx.author.id, key)
+            if reply is not None:
+                reply.parts.append(content)
+                del reply.parts[:-self.coalesce_max]
+                self.coalesced += 1
+                self._hold(reply)
+                self._enqueue(ch, reply)
+                return reply
+        reply = Reply(ctx, key, content, embed)
+        self._hold(reply)
+        self._enqueue(ch, reply)
+        return reply
+
+    async def edit(self, reply: Reply, content: str):
+        # ersetzt den Inhalt; noch nicht gesendet -> es geht gleich die neue Fassung raus
+        reply.parts = [content]
+        if reply.ctx.interaction is not None:
+            await reply.message.edit(content=content)
+            return
+        self._hold(reply)
+        self._enqueue(self._channel(reply.channel_id), reply)
+
+    async def flush(self, timeout: float = 5.0):
+        # vor einem Neustart: laufende Queues möglichst noch zustellen
+        workers = [ch.worker for ch in self._channels.values() if ch.worker and not ch.worker.done()]
+        if workers:
+            await asyncio.wait(workers, timeout=timeout)
+
+    def _coalesce_target(self, ch: _Channel, user_id: int, key: str) -> Optional[Reply]:
+        for reply in reversed(ch.queue):
+            if reply.user_id == user_id and reply.key == key:
+                return reply
+        last = ch.last
+        if (last is not None and last.user_id == user_id and last.key == key and last.message is not None
+                and time.monotonic() - last.sent_at <= self.coalesce_window):
+            return last
+        return None
+
+    def _hold(self, reply: Reply):
+        if self.metrics is not None:
+            timer = self.metrics.hold()
+            if timer is not None:
+                reply.timers.append(timer)
+
+    def _release(self, reply: Reply, seconds: float):
+        timers, reply.timers = reply.timers, []
+        for timer in timers:
+            self.metrics.release(timer, seconds)
+
+    def _channel(self, channel_id: int) -> _Channel:
+        ch = self._channels.get(channel_id)
+        if ch is None:
+            self._prune()
+            ch = self._channels[channel_id] = _Channel(self.rate)
+        return ch
+
+    def _prune(self):
+        # ruhige Channels vergessen (Bucket wieder voll, Coalescing-Fenster vorbei)
+        now = time.monotonic()
+        if now - self._pruned < self.coalesce_window:
+            return
+        self._pruned = now
+        idle = max(self.coalesce_window, self.per)
+        for cid in [cid for cid, ch in self._channels.items()
+                    if not ch.queue and now - ch.active > idle and (ch.worker is None or ch.worker.done())]:
+            del self._channels[cid]
+
+    def _enqueue(self, ch: _Channel, reply: Reply):
+        ch.active = time.monotonic()
+        if not reply.queued:
+            reply.queued = True
+            ch.queue.append(reply)
+        if ch.worker is None or ch.worker.done():
+            ch.worker = asyncio.create_task(self._drain(ch))
+
+    async def _take_token(self, ch: _Channel):
+        while True:
+            now = time.monotonic()
+            ch.tokens = min(self.rate, ch.tokens + (now - ch.refilled) * self.rate / self.per)
+            ch.refilled = now
+            if ch.tokens >= 1:
+                ch.tokens -= 1
+                return
+            await asyncio.sleep((1 - ch.tokens) * self.per / self.rate)
+
+    async def _drain(self, ch: _Channel):
+        if self.metrics is not None:
+            self.metrics.detach()  # Zustellzeit wird per Reply.timers zugerechnet
+        while ch.queue:
+            await self._take_token(ch)
+            # erst nach dem Warten entnehmen: bis dahin eintreffende Ergebnisse landen noch in derselben Nachricht
+            reply = ch.queue.popleft()
+            reply.queued = False
+            t0 = time.perf_counter()
+            try:
+                await self._deliver(reply)
+                ch.last = reply
+            except Exception as e:
+                self.errors += 1
+                reply._failed(e)
+                print(f"[outbox] delivery to channel {reply.channel_id} failed: {e}")
+            finally:
+                self._release(reply, time.perf_counter() - t0)
+            ch.active = time.monotonic()
+
+    async def _deliver(self, reply: Reply):
+        content = reply.render(self.coalesce_max)
+        if reply.message is not None:
+            try:
+                await reply.message.edit(content=content)
+                reply.sent_at = time.monotonic()
+                self.edited += 1
+                return
+            except discord.NotFound:
+                reply.message = None  # inzwischen gelöscht -> neu senden
+        reply._delivered(await reply.ctx.reply(content, embed=reply.embed, mention_author=False))
+        self.sent += 1
@@ -0,0 +1,115 @@
+# profilecache.py — Begrenzter LRU-Cache heißer Profile über dem SQLite-Store
+# Kalte Profile liegen nur im Backend (eine Zeile pro User) und werden beim
+# Zugriff nachgeladen. Verdrängt werden nur saubere Profile: gepinnte User
+# (dirty, laufende Transaktion, Flush unterwegs) bleiben im Speicher, bis der
+# Flusher sie geschrieben hat; der Cache kann also kurzzeitig über capacity
+# liegen. Nach außen verhält sich der Cache wie das users-Dict.
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+
+class ProfileCache:
+    def __init__(
+        self,
+        backend,
+        decode: Callable[[Dict[str, Any]], Any],
+        capacity: int,
+        pinned: Callable[[str], bool],
+    ):
+        self.backend = backend  # storage.SqliteBackend (load_user/has_user/iter_users)
+        self.capacity = capacity
+        self._decode = decode
+        self._pinned = pinned
+        self._hot: "OrderedDict[str, Any]" = OrderedDict()
+        self._count = backend.count_users()  # alle User, heiß + kalt
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def resident(self) -> int:
+        return len(self._hot)
+
+    def __contains__(self, uid: str) -> bool:
+        return uid in self._hot or self.backend.has_user(uid)
+
+    def get(self, uid: str, default=None):
+        prof = self._hot.get(uid)
+        if prof is not None:
+            self._hot.move_to_end(uid)
+            self.hits += 1
+            return prof
+        self.misses += 1
+        raw = self.backend.load_user(uid)
+        if raw is None:
+            return default
+        prof = self._decode(raw)
+        self._hot[uid] = prof
+        self.trim(keep=uid)
+        return prof
+
+    def __getitem__(self, uid: str):
+        prof = self.get(uid)
+        if prof is None:
+            raise KeyError(uid)
+        return prof
+
+    def __setitem__(self, uid: str, prof):
+        if uid not in self._hot and not self.backend.has_user(uid):
+            self._count += 1
+        self._hot[uid] = prof
+        self._hot.move_to_end(uid)
+        self.trim(keep=uid)
+
+    def update(self, profiles: Dict[str, Any]):
+        for uid, prof in profiles.items():
+            self[uid] = prof
+
+    def peek(self, uid: str):
+        # nur heiße Profile, ohne LRU-Reihenfolge oder Zähler anzufassen
+        return self._hot.get(uid)
+
+    def peek_many(self, uids: Iterable[str]) -> Dict[str, Any]:
+        return {uid: self._hot[uid] for uid in uids if uid in self._hot}
+
+    def _scan(self, decode: bool) -> Iterator[Tuple[str, Any]]:
+        # alle User: heiße aus dem Cache, kalte direkt vom Backend (ohne sie aufzunehmen)
+        seen = set()
+        for uid, raw in self.backend.iter_users():
+            prof = self._hot.get(uid)
+            if prof is not None:
+                seen.add(uid)
+            elif decode:
+                prof = self._decode(raw)
+            yield uid, prof
+        for uid, prof in list(self._hot.items()):
+            if uid not in seen:  # neu angelegt, noch nicht geschrieben
+                yield uid, prof
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return self._scan(decode=True)
+
+    def keys(self) -> Iterator[str]:
+        return (uid for uid, _ in self._scan(decode=False))
+
+    __iter__ = keys
+
+    def trim(self, keep: Optional[str] = None):
+        # älteste saubere Profile verdrängen; schreibt nie selbst (kein I/O auf dem Event-Loop).
+        # keep = gerade eingefügter User: der Aufrufer arbeitet mit genau diesem Objekt weiter
+        over = len(self._hot) - self.capacity
+        if over <= 0:
+            return
+        victims = []
+        for uid in self._hot:  # älteste zuerst
+            if len(victims) >= over:
+                break
+            if uid != keep and not self._pinned(uid):
+                victims.append(uid)
+        for uid in victims:
+            del self._hot[uid]
+        self.evictions += len(victims)
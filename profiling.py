@@ -0,0 +1,98 @@
+# profiling.py — Profiling auf Abruf für den laufenden Bot (/profile)
+# cProfile + tracemalloc laufen nur während des angeforderten Fensters;
+# außerhalb davon ist nichts aktiv (kein Overhead im Normalbetrieb).
+
+import io
+import time
+import pstats
+import asyncio
+import cProfile
+import tracemalloc
+from typing import List, Optional
+
+TOP_FUNCTIONS = 30
+TOP_ALLOCATIONS = 25
+TRACEMALLOC_FRAMES = 10
+
+_running = False
+
+
+def is_running() -> bool:
+    return _running
+
+
+def task_dump() -> str:
+    # Alle asyncio-Tasks mit aktueller Zeile (wo wartet der Task gerade?)
+    lines: List[str] = []
+    tasks = sorted(asyncio.all_tasks(), key=lambda t: t.get_name())
+    lines.append(f"{len(tasks)} asyncio tasks")
+    for task in tasks:
+        coro = task.get_coro()
+        name = getattr(coro, "__qualname__", repr(coro))
+        state = "done" if task.done() else "pending"
+        where = ""
+        stack = task.get_stack(limit=1)
+        if stack:
+            frame = stack[-1]
+            where = f" @ {frame.f_code.co_filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+        lines.append(f"  [{state}] {task.get_name()}: {name}{where}")
+    return "\n".join(lines)
+
+
+async def capture(seconds: float) -> str:
+    # Profil über `seconds` Sekunden Event-Loop-Betrieb; gibt den Bericht als Text zurück
+    global _running
+    if _running:
+        raise RuntimeError("a profile capture is already running")
+    _running = True
+    started_tracing = not tracemalloc.is_tracing()
+    profiler: Optional[cProfile.Profile] = cProfile.Profile()
+    try:
+        if started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        before = tracemalloc.take_snapshot()
+        t0 = time.perf_counter()
+        try:
+            profiler.enable()
+        except ValueError:
+            profiler = None  # anderer Profiler aktiv -> nur Speicher + Tasks
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+        elapsed = time.perf_counter() - t0
+        after = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+        _running = False
+
+    out = io.StringIO()
+    out.write(f"Profile window: {elapsed:.1f}s\n\n")
+    if profiler is not None:
+        for sort in ("cumulative", "tottime"):
+            out.write(f"=== Top {TOP_FUNCTIONS} functions by {sort} time ===\n")
+            stats = pstats.Stats(profiler, stream=out)
+            stats.strip_dirs().sort_stats(sort).print_stats(TOP_FUNCTIONS)
+    else:
+        out.write("cProfile unavailable (another profiler is active)\n\n")
+
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ]
+    after = after.filter_traces(filters)
+    before = before.filter_traces(filters)
+    out.write(f"=== Top {TOP_ALLOCATIONS} allocation sites (growth during window) ===\n")
+    for stat in after.compare_to(before, "lineno")[:TOP_ALLOCATIONS]:
+        out.write(f"{stat}\n")
+    out.write(f"\n=== Top {TOP_ALLOCATIONS} allocation sites (live at end of window) ===\n")
+    for stat in after.statistics("lineno")[:TOP_ALLOCATIONS]:
+        out.write(f"{stat}\n")
+    out.write(f"\ntraced memory: current {current / 1024:.0f} KiB, peak {peak / 1024:.0f} KiB\n\n")
+
+    out.write("=== asyncio tasks ===\n")
+    out.write(task_dump() + "\n")
+    return out.getvalue()
@@ -0,0 +1,53 @@
+# ratelimit.py — Token-Buckets pro User für Command-Gruppen (casino, bank, rob, shop)
+# Ein Eintrag (Tokens, Zeitstempel) pro aktivem User; wer länger als ein volles
+# Nachfüll-Intervall ruhig war, hat wieder einen vollen Bucket und wird vergessen.
+
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from discord.ext import commands
+
+
+class Throttled(commands.CheckFailure):
+    def __init__(self, group: str, retry_after: float):
+        self.group = group
+        self.retry_after = retry_after
+        super().__init__(f"{group} commands throttled, retry in {retry_after:.1f}s")
+
+
+class TokenBuckets:
+    def __init__(self, burst: int, per: float):
+        self.burst = burst          # so viele Aufrufe am Stück ...
+        self.rate = burst / per     # ... danach burst pro `per` Sekunden
+        self.idle = per             # nach `per` Sekunden Ruhe ist jeder Bucket wieder voll
+        # älteste Nutzung vorne -> Eviction schaut nur auf den Anfang
+        self._buckets: "OrderedDict[Hashable, Tuple[float, float]]" = OrderedDict()
+        self.allowed = 0
+        self.throttled = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def take(self, key: Hashable, now: Optional[float] = None) -> float:
+        # 0.0 = erlaubt (Token verbraucht), sonst Sekunden bis zum nächsten Token
+        now = time.monotonic() if now is None else now
+        self._evict(now)
+        entry = self._buckets.pop(key, None)
+        tokens = self.burst if entry is None else min(self.burst, entry[0] + (now - entry[1]) * self.rate)
+        if tokens >= 1:
+            self._buckets[key] = (tokens - 1, now)
+            self.allowed += 1
+            return 0.0
+        self._buckets[key] = (tokens, now)
+        self.throttled += 1
+        return (1 - tokens) / self.rate
+
+    def _evict(self, now: float):
+        while self._buckets:
+            key, (_, stamp) = next(iter(self._buckets.items()))
+            if now - stamp < self.idle:
+                break
+            del self._buckets[key]
+            self.evicted += 1
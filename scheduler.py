@@ -0,0 +1,107 @@
+# scheduler.py — Deadline-Scheduler (Min-Heap) für fällige User-Ereignisse
+# Statt jede Minute alle Profile zu scannen, wird pro User und Art nur der
+# nächste Zeitpunkt gemerkt (Job-Zahlung, Effekt-Ende, Rob-Cooldown).
+# Der Loop schläft bis zur frühesten Deadline und fasst nur fällige User an.
+
+import os
+import json
+import time
+import heapq
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class DeadlineScheduler:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._heap: List[Tuple[float, str, str]] = []   # (when, uid, kind)
+        self._next: Dict[str, Dict[str, float]] = {}    # maßgeblich; der Heap darf veraltete Einträge haben
+        self._wakeup = asyncio.Event()
+        self.changed = False
+
+    def __len__(self) -> int:
+        return sum(len(kinds) for kinds in self._next.values())
+
+    def _is_current(self, when: float, uid: str, kind: str) -> bool:
+        return self._next.get(uid, {}).get(kind) == when
+
+    def replace(self, uid: str, deadlines: Dict[str, float]):
+        # Alle Deadlines eines Users neu setzen (nach jeder Mutation)
+        if self._next.get(uid, {}) == deadlines:
+            return
+        head = self.next_deadline()
+        if deadlines:
+            self._next[uid] = dict(deadlines)
+        else:
+            self._next.pop(uid, None)
+        for kind, when in deadlines.items():
+            heapq.heappush(self._heap, (when, uid, kind))
+        self.changed = True
+        if deadlines and (head is None or min(deadlines.values()) < head):
+            self._wakeup.set()
+
+    def next_deadline(self) -> Optional[float]:
+        # veraltete Heap-Einträge (verschoben/abgebrochen) lazy entfernen
+        while self._heap:
+            when, uid, kind = self._heap[0]
+            if self._is_current(when, uid, kind):
+                return when
+            heapq.heappop(self._heap)
+        return None
+
+    def pop_due(self, now: Optional[float] = None) -> Set[str]:
+        now = time.time() if now is None else now
+        due: Set[str] = set()
+        while True:
+            when = self.next_deadline()
+            if when is None or when > now:
+                break
+            _, uid, kind = heapq.heappop(self._heap)
+            kinds = self._next[uid]
+            del kinds[kind]
+            if not kinds:
+                del self._next[uid]
+            due.add(uid)
+            self.changed = True
+        return due
+
+    async def wait(self):
+        # Schläft bis zur frühesten Deadline oder bis eine frühere eingeplant wird
+        while True:
+            when = self.next_deadline()
+            timeout = None if when is None else when - time.time()
+            if timeout is not None and timeout <= 0:
+                return
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return
+
+    # ---- Persistenz (schneller Neustart ohne Voll-Scan)
+    def dump(self, seq: int) -> str:
+        self.changed = False
+        return json.dumps({"seq": seq, "users": self._next}, separators=(",", ":"))
+
+    def write(self, payload: str):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp, self.path)
+
+    def restore(self, seq: int) -> bool:
+        # Nur verwenden, wenn der Index zum geladenen Snapshot passt
+        if not self.path or not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except Exception:
+            return False
+        if saved.get("seq") != seq:
+            return False
+        self._next = saved.get("users", {})
+        self._heap = [(when, uid, kind) for uid, kinds in self._next.items() for kind, when in kinds.items()]
+        heapq.heapify(self._heap)
+        self._wakeup.set()
+        return True
@@ -0,0 +1,149 @@
+# simulate.py — Offline-Monte-Carlo für Casino-Hausvorteil und Geldmengen-Drift
+# Nutzt dieselben Quoten/Auflösungen wie der Bot (games.py), aber als
+# NumPy-Batches, verteilt auf einen Prozess-Pool. Kein Discord nötig.
+#
+#   python simulate.py --rounds 10000000 --luck 0,5 --json sim.json
+#
+# Pro Spiel (und Boost-Stufe) wird je Runde gemessen:
+#   net   = Gewinn/Verlust des Spielers (EV, Varianz)
+#   drift = Geld, das dabei entsteht (+) oder vernichtet wird (-)
+
+import os
+import sys
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+from games import (
+    np, SLOTS_SYMBOLS, SLOTS_JACKPOT_MULT, SLOTS_TWOMATCH_MULT, ROULETTE_CHOICES,
+    LOTTO_TICKET_PRICE, LOTTO_WIN_PCT,
+    slots_payout_table, slots_mults, roulette_wins, blackjack_draws, rob_attempts, lottery_winners,
+)
+
+GAMES = ("slots", "roulette", "blackjack", "rob", "lottery")
+
+
+def _round_results(game: str, level: int, rng, n: int, args) -> Tuple[Any, Any]:
+    # (net, drift) je Runde als Arrays
+    bet = args.bet
+    if game == "slots":
+        table = slots_payout_table(len(SLOTS_SYMBOLS), level, SLOTS_JACKPOT_MULT, SLOTS_TWOMATCH_MULT)
+        net = bet * slots_mults(rng, n, table) - bet
+        return net, net
+    if game == "roulette":
+        net = np.where(roulette_wins(rng, n, next(iter(ROULETTE_CHOICES))), bet, -bet)
+        return net, net
+    if game == "blackjack":
+        player, dealer = blackjack_draws(rng, n)
+        net = np.sign(player - dealer) * bet
+        return net, net
+    if game == "rob":
+        # Beute wandert nur zwischen Spielern; die Strafe verschwindet
+        _, loot, fine = rob_attempts(rng, n, args.wallet, args.wallet)
+        return loot - fine, -fine
+    if game == "lottery":
+        # Spieler 0 gegen (players - 1) Mitspieler mit gleich vielen Tickets
+        counts = [args.lotto_tickets] * args.lotto_players
+        pot = sum(counts) * LOTTO_TICKET_PRICE
+        jackpot_win = int(pot * LOTTO_WIN_PCT)
+        won = lottery_winners(rng, n, counts) == 0
+        net = np.where(won, jackpot_win, 0) - counts[0] * LOTTO_TICKET_PRICE
+        return net, np.full(n, jackpot_win - pot)
+    raise ValueError(f"unknown game: {game}")
+
+
+def _run_chunk(job: Tuple[str, int, int, Any, argparse.Namespace]) -> Tuple[str, int, int, float, float, float]:
+    game, level, n, seed, args = job
+    rng = np.random.default_rng(seed)
+    net, drift = _round_results(game, level, rng, n, args)
+    net = net.astype(np.float64)
+    return game, level, n, float(net.sum()), float((net * net).sum()), float(drift.sum())
+
+
+def _jobs(args, seeds) -> List[Tuple[str, int, int, Any, argparse.Namespace]]:
+    jobs = []
+    for game in args.games:
+        levels = args.luck if game == "slots" else [0]
+        for level in levels:
+            left = args.rounds
+            while left > 0:
+                n = min(left, args.chunk)
+                jobs.append((game, level, n, seeds.spawn(1)[0], args))
+                left -= n
+    return jobs
+
+
+def simulate(args) -> List[Dict[str, Any]]:
+    totals: Dict[Tuple[str, int], List[float]] = {}
+    jobs = _jobs(args, np.random.SeedSequence(args.seed))
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for game, level, n, s, s2, d in pool.map(_run_chunk, jobs):
+            acc = totals.setdefault((game, level), [0, 0.0, 0.0, 0.0])
+            acc[0] += n
+            acc[1] += s
+            acc[2] += s2
+            acc[3] += d
+
+    results = []
+    for (game, level), (n, s, s2, d) in totals.items():
+        stake = args.bet if game in ("slots", "roulette", "blackjack") else (
+            args.lotto_tickets * LOTTO_TICKET_PRICE if game == "lottery" else None
+        )
+        ev = s / n
+        var = max(0.0, s2 / n - ev * ev)
+        results.append({
+            "game": game,
+            "luck_pct": level if game == "slots" else None,
+            "rounds": n,
+            "ev": ev,
+            "ev_pct_of_stake": (ev / stake * 100.0) if stake else None,
+            "variance": var,
+            "stddev": var ** 0.5,
+            "drift_per_round": d / n,
+        })
+    return results
+
+
+def _print_table(results: List[Dict[str, Any]]):
+    print(f"{'game':<10} {'luck':>5} {'rounds':>12} {'EV':>12} {'EV %':>8} {'stddev':>12} {'drift/round':>12}")
+    for r in results:
+        luck = "" if r["luck_pct"] is None else f"{r['luck_pct']}%"
+        pct = "" if r["ev_pct_of_stake"] is None else f"{r['ev_pct_of_stake']:+.2f}"
+        print(f"{r['game']:<10} {luck:>5} {r['rounds']:>12} {r['ev']:>+12.4f} {pct:>8} {r['stddev']:>12.4f} {r['drift_per_round']:>+12.4f}")
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Monte-Carlo balance check for the casino games")
+    ap.add_argument("--games", default=",".join(GAMES), help="comma-separated subset of " + ", ".join(GAMES))
+    ap.add_argument("--rounds", type=int, default=5_000_000, help="rounds per game and boost level")
+    ap.add_argument("--chunk", type=int, default=1_000_000, help="rounds per worker task")
+    ap.add_argument("--workers", type=int, default=os.cpu_count())
+    ap.add_argument("--bet", type=int, default=100)
+    ap.add_argument("--luck", default="0,5", help="slots luck boost levels in percent")
+    ap.add_argument("--wallet", type=int, default=1000, help="attacker/victim wallet for rob")
+    ap.add_argument("--lotto-players", type=int, default=10)
+    ap.add_argument("--lotto-tickets", type=int, default=1, help="tickets per lottery player")
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--json", help="also write results to this file")
+    args = ap.parse_args(argv)
+
+    if np is None:
+        print("simulate.py needs NumPy (pip install numpy).")
+        return 2
+    args.games = [g.strip() for g in args.games.split(",") if g.strip()]
+    unknown = set(args.games) - set(GAMES)
+    if unknown:
+        ap.error(f"unknown game(s): {', '.join(sorted(unknown))}")
+    args.luck = [int(x) for x in args.luck.split(",") if x.strip()]
+
+    results = simulate(args)
+    _print_table(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+# snapshot.py — Konsistente Lese-Sicht auf den Economy-Store (Copy-on-Write)
+# Ein Snapshot kopiert beim Anlegen keine Profile: er merkt sich nur, welche
+# User er umfasst, und liest sie live. Erst wenn ein Schreiber einen davon
+# ändern will, hinterlegt die Economy vorher den übernommenen Stand im
+# Snapshot (economy.touch / Transaktionen). Jedes Profil wird so höchstens
+# einmal pro offenem Snapshot kopiert, und nur wenn es sich wirklich ändert.
+#
+# export() darf aus einem Worker-Thread laufen (Flush); get()/items() nur auf
+# dem Event-Loop, weil ausgelagerte Profile dabei nachgeladen werden.
+
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+
+class Snapshot:
+    def __init__(
+        self,
+        users,
+        meta: Dict[str, Any],
+        uids: Iterable[str],
+        peek: Callable[[str], Any],
+        release: Callable[["Snapshot"], None],
+    ):
+        self.meta = meta            # Kopie zum Zeitpunkt des Snapshots
+        self._users = users         # economy.users (dict oder ProfileCache)
+        self._keys = dict.fromkeys(uids)
+        self._frozen: Dict[str, Any] = {}  # vor einer Änderung hinterlegte Stände
+        self._peek = peek           # thread-sicheres Lesen ohne Nachladen
+        self._release = release
+        # nur zwischen export() (Worker) und _freeze() (Event-Loop) umkämpft, je Profil kurz
+        self._lock = Lock()
+        self.closed = False
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, uid: str) -> bool:
+        return uid in self._keys
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self._release(self)
+            self._frozen = {}
+
+    @property
+    def frozen(self) -> int:
+        return len(self._frozen)
+
+    def _wants(self, uid: str) -> bool:
+        return uid in self._keys and uid not in self._frozen
+
+    def _freeze(self, uid: str, prof):
+        # prof = übernommener Stand vor der Änderung; wird danach nicht mehr verändert
+        with self._lock:
+            self._frozen.setdefault(uid, prof)
+
+    # ---- Lesen (Event-Loop)
+    def get(self, uid: str, default=None):
+        uid = str(uid)
+        if uid not in self._keys:
+            return default
+        prof = self._frozen.get(uid)
+        return prof if prof is not None else self._users.get(uid, default)
+
+    def keys(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        for uid in self._keys:
+            yield uid, self.get(uid)
+
+    # ---- Serialisieren (Worker-Thread)
+    def export(self) -> Dict[str, Dict[str, Any]]:
+        # JSON-Layout aller Profile im Snapshot; ein Schreiber wartet höchstens
+        # auf das Profil, das gerade kodiert wird. Ausgelagerte User fehlen (der Flush
+        # pinnt seine User, siehe Economy._pinned).
+        out: Dict[str, Dict[str, Any]] = {}
+        for uid in self._keys:
+            with self._lock:
+                prof: Optional[Any] = self._frozen.get(uid)
+                if prof is None:
+                    prof = self._peek(uid)
+                    if prof is None:  # nicht (mehr) im Speicher
+                        continue
+                out[uid] = prof.to_dict()
+        return out
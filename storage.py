@@ -0,0 +1,286 @@
+# storage.py — Austauschbare Persistenz-Backends für den Economy-Store
+# JsonBackend: eine Datei (Default, für kleine Installationen)
+# SqliteBackend: eine Zeile pro User (WAL), Updates als Einzel-UPSERTs
+#
+# Journal: Append-only Änderungsprotokoll (eine JSON-Zeile pro Mutation),
+#          wird beim Flush in den Snapshot des Backends gefaltet
+#
+# Einmaliger Import:  python storage.py import data.json data.db
+
+import os
+import sys
+import json
+import sqlite3
+from threading import Lock
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
+
+
+def _encode(obj):
+    # Profil-Objekte (userprofile.UserProfile) im bisherigen JSON-Layout speichern
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_encode)
+
+
+class JsonBackend:
+    name = "json"
+    partial = False  # prepare() braucht immer alle User
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        # None = noch keine (lesbaren) Daten vorhanden
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            backup = f"{self.path}.backup-{int(datetime.utcnow().timestamp())}"
+            try:
+                os.rename(self.path, backup)
+            except Exception:
+                pass
+            return None
+
+    def prepare(self, data: Dict[str, Any], dirty: Set[str]) -> str:
+        # Eine Datei => immer der komplette Zustand. User einzeln kodieren: json.dumps
+        # gibt den GIL nicht ab, ein Dump am Stück würde den Event-Loop blockieren.
+        users = ",".join(f"{_dumps(uid)}:{_dumps(prof)}" for uid, prof in data["users"].items())
+        rest = _dumps({k: v for k, v in data.items() if k != "users"})
+        return '{"users":{' + users + "}" + ("," + rest[1:] if rest != "{}" else "}")
+
+    def write(self, payload: str):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp, self.path)
+
+    def close(self):
+        pass
+
+
+class SqliteBackend:
+    name = "sqlite"
+    partial = True   # prepare() braucht nur die geänderten User
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS users (
+        user_id            TEXT PRIMARY KEY,
+        wallet             INTEGER NOT NULL DEFAULT 0,
+        bank               INTEGER NOT NULL DEFAULT 0,
+        rob_cooldown_until INTEGER,
+        profile            TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_users_wallet ON users(wallet);
+    CREATE INDEX IF NOT EXISTS idx_users_bank ON users(bank);
+    CREATE INDEX IF NOT EXISTS idx_users_rob_cd ON users(rob_cooldown_until);
+    CREATE TABLE IF NOT EXISTS meta (
+        key   TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+    """
+
+    UPSERT_USER = """
+    INSERT INTO users (user_id, wallet, bank, rob_cooldown_until, profile)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(user_id) DO UPDATE SET
+        wallet = excluded.wallet,
+        bank = excluded.bank,
+        rob_cooldown_until = excluded.rob_cooldown_until,
+        profile = excluded.profile
+    """
+
+    UPSERT_META = """
+    INSERT INTO meta (key, value) VALUES (?, ?)
+    ON CONFLICT(key) DO UPDATE SET value = excluded.value
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = Lock()
+        # Schreibzugriffe kommen aus Worker-Threads (asyncio.to_thread)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._conn.commit()
+        # Einzel-Lesezugriffe (Profile nachladen) nur vom Event-Loop: eigene Verbindung,
+        # WAL lässt sie parallel zu einem laufenden Flush lesen
+        self._reader = sqlite3.connect(path, check_same_thread=False)
+
+    def load(self, users: bool = True) -> Optional[Dict[str, Any]]:
+        # users=False: nur Meta, Profile werden bei Bedarf per load_user nachgeladen
+        with self._lock:
+            meta = {k: json.loads(v) for k, v in self._conn.execute("SELECT key, value FROM meta")}
+            if users:
+                profiles = {uid: json.loads(p) for uid, p in self._conn.execute("SELECT user_id, profile FROM users")}
+                empty = not profiles
+            else:
+                profiles = {}
+                empty = self._conn.execute("SELECT 1 FROM users LIMIT 1").fetchone() is None
+        if not meta and empty:
+            return None
+        return {"users": profiles, "meta": meta}
+
+    def load_user(self, uid: str) -> Optional[Dict[str, Any]]:
+        row = self._reader.execute("SELECT profile FROM users WHERE user_id = ?", (uid,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def has_user(self, uid: str) -> bool:
+        return self._reader.execute("SELECT 1 FROM users WHERE user_id = ?", (uid,)).fetchone() is not None
+
+    def count_users(self) -> int:
+        return self._reader.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    def iter_users(self, chunk: int = 1000) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        # blockweise nach user_id, damit kein Cursor über Schreibvorgänge hinweg offen bleibt
+        last = ""
+        while True:
+            rows = self._reader.execute(
+                "SELECT user_id, profile FROM users WHERE user_id > ? ORDER BY user_id LIMIT ?", (last, chunk)
+            ).fetchall()
+            if not rows:
+                return
+            for uid, p in rows:
+                yield uid, json.loads(p)
+            last = rows[-1][0]
+
+    @staticmethod
+    def _row(uid: str, prof: Dict[str, Any]) -> Tuple[str, int, int, Optional[int], str]:
+        return (
+            uid,
+            int(prof.get("wallet", 0)),
+            int(prof.get("bank", 0)),
+            prof.get("rob_cooldown_until"),
+            _dumps(prof),
+        )
+
+    def prepare(self, data: Dict[str, Any], dirty: Set[str]) -> Tuple[List[tuple], List[tuple]]:
+        # Nur geänderte User serialisieren; "*" = alles (Erstanlage/Import)
+        users = data["users"]
+        uids = users.keys() if "*" in dirty else (u for u in dirty if u in users)
+        rows = [self._row(uid, users[uid]) for uid in uids]
+        meta = [(k, json.dumps(v, ensure_ascii=False)) for k, v in data["meta"].items()]
+        return rows, meta
+
+    def write(self, payload: Tuple[List[tuple], List[tuple]]):
+        rows, meta = payload
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(self.UPSERT_USER, rows)
+                self._conn.executemany(self.UPSERT_META, meta)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+        self._reader.close()
+
+
+class Journal:
+    # Segmente: <path> (aktiv) und <path>.compacting (wird gerade in den
+    # Snapshot geschrieben und nach erfolgreichem Schreiben gelöscht).
+    def __init__(self, path: str, fsync: bool = False):
+        self.path = path
+        self.compacting_path = path + ".compacting"
+        self.fsync = fsync
+        self.seq = 0
+        self._f = None
+
+    def replay(self, after_seq: int) -> Iterator[Dict[str, Any]]:
+        # Liefert alle Einträge nach dem Snapshot-Stand (älteres Segment zuerst)
+        self.seq = max(self.seq, after_seq)
+        for path in (self.compacting_path, self.path):
+            if not os.path.exists(path):
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # abgeschnittene letzte Zeile nach Absturz
+                    if entry.get("seq", 0) > after_seq:
+                        self.seq = max(self.seq, entry["seq"])
+                        yield entry
+
+    def open(self):
+        if self._f is None:
+            self._f = open(self.path, "a", encoding="utf-8")
+
+    def append(self, entry: Dict[str, Any]) -> int:
+        self.open()
+        self.seq += 1
+        entry["seq"] = self.seq
+        self._f.write(_dumps(entry) + "\n")
+        self._f.flush()
+        if self.fsync:
+            os.fsync(self._f.fileno())
+        return self.seq
+
+    def rotate(self) -> int:
+        # Aktives Segment abschließen; neue Einträge landen in einer frischen Datei
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+        if os.path.exists(self.path):
+            if os.path.exists(self.compacting_path):
+                # vorherige Kompaktierung ist fehlgeschlagen -> Segmente zusammenführen
+                with open(self.path, "r", encoding="utf-8") as src, \
+                        open(self.compacting_path, "a", encoding="utf-8") as dst:
+                    dst.write(src.read())
+                os.remove(self.path)
+            else:
+                os.replace(self.path, self.compacting_path)
+        return self.seq
+
+    def discard_compacted(self):
+        try:
+            os.remove(self.compacting_path)
+        except FileNotFoundError:
+            pass
+
+    def close(self):
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+
+def open_backend(kind: str, json_path: str, sqlite_path: str):
+    kind = (kind or "json").lower()
+    if kind == "json":
+        return JsonBackend(json_path)
+    if kind == "sqlite":
+        fresh = not os.path.exists(sqlite_path)
+        backend = SqliteBackend(sqlite_path)
+        # Erster Start mit SQLite: vorhandene data.json automatisch übernehmen
+        if fresh and os.path.exists(json_path):
+            count = import_json(json_path, backend)
+            print(f"[storage] imported {count} users from {json_path} into {sqlite_path}")
+        return backend
+    raise ValueError(f"Unknown storage backend: {kind}")
+
+
+def import_json(json_path: str, target: SqliteBackend) -> int:
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    data.setdefault("users", {})
+    data.setdefault("meta", {})
+    target.write(target.prepare(data, {"*"}))
+    return len(data["users"])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] != "import":
+        print("Usage: python storage.py import <data.json> <data.db>")
+        sys.exit(2)
+    backend = SqliteBackend(sys.argv[3])
+    try:
+        print(f"Imported {import_json(sys.argv[2], backend)} users.")
+    finally:
+        backend.close()
@@ -0,0 +1,55 @@
+# tests/test_profilecache.py — Hot-Set voller gepinnter (dirty) Profile
+# Ein nachgeladenes bzw. neu angelegtes Profil darf nicht sofort wieder
+# verdrängt werden, sonst arbeitet der Aufrufer auf einem abgehängten Objekt.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from economy import Economy
+from storage import SqliteBackend
+from userprofile import UserProfile
+
+
+def _economy(path, capacity):
+    e = Economy(SqliteBackend(path), lambda: UserProfile(100), decode=UserProfile.from_dict,
+                cache_capacity=capacity)
+    e.load()
+    return e
+
+
+def test_fault_in_and_create_with_dirty_hot_set(tmp_path):
+    path = str(tmp_path / "data.db")
+    e = _economy(path, 3)
+    for uid in "01234":
+        e.get(uid)
+    e.flush()
+    e.backend.close()
+
+    e = _economy(path, 3)
+    for uid in "012":
+        e.get(uid)
+
+    def settle(uid, prof):
+        # wie Lazy-Lohn: Abrechnung beim Lesen, sofort übernommen
+        prof["wallet"] += 300
+        e.record("payout", uid)
+
+    e._settle = settle
+    e.mark_dirty("0", "1", "2")  # Hot-Set voll und komplett gepinnt
+
+    prof = e.get("4")  # bestehendes, ausgelagertes Profil: nachladen + abrechnen
+    assert prof["wallet"] == 400
+    assert e.cache.peek("4") is prof
+
+    e._settle = None
+    new = e.get("7")  # neues Profil: darf in record() nicht fehlen
+    assert e.cache.peek("7") is new
+
+    e.flush()
+    e.backend.close()
+    e = _economy(path, 3)
+    assert e.users["4"]["wallet"] == 400
+    assert "7" in e.users
+    e.backend.close()
@@ -0,0 +1,175 @@
+# userprofile.py — Kompakte Profil-Darstellung (__slots__) für sehr viele User
+# Ganzzahlige Felder, internierte Job-/Item-Namen, Inventar als Zähler pro Name
+# und Effekte in einer festen Liste (ein Platz pro bekanntem Effekt, None wenn
+# keiner aktiv ist). Skalare Felder bleiben per prof["wallet"] / prof.get("job")
+# erreichbar; to_dict()/from_dict() schreiben bzw. lesen das bisherige JSON-Layout.
+
+import sys
+import copy
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+EFFECT_KEYS = ("shield", "job_boost", "luck_boost", "interest_boost")
+_EFFECT_SLOTS = {key: i for i, key in enumerate(EFFECT_KEYS)}
+_PERCENT_EFFECTS = frozenset(("job_boost", "luck_boost", "interest_boost"))
+
+# per prof[...] erreichbare Felder
+FIELDS = (
+    "wallet", "bank", "job", "income", "last_pay", "job_offers", "offers_expires",
+    "last_interest", "interest_carry", "rob_cooldown_until",
+)
+_FIELD_SET = frozenset(FIELDS)
+
+
+class Effect(NamedTuple):
+    until: Optional[int]
+    percent: int = 0
+
+
+def _intern(name: Optional[str]) -> Optional[str]:
+    return sys.intern(name) if name is not None else None
+
+
+class UserProfile:
+    __slots__ = FIELDS + ("_inventory", "_effects", "_extra")
+
+    def __init__(self, wallet: int = 0, bank: int = 0, job: Optional[str] = None, income: int = 0,
+                 last_pay: Optional[int] = None, last_interest: Optional[int] = None):
+        self.wallet = wallet
+        self.bank = bank
+        self.job = _intern(job)
+        self.income = income
+        self.last_pay = last_pay
+        self.job_offers: Tuple[str, ...] = ()
+        self.offers_expires: Optional[int] = None
+        self.last_interest = last_interest
+        self.interest_carry = 0.0  # Nachkommaanteil der Zinsen (Bank bleibt ganzzahlig)
+        self.rob_cooldown_until: Optional[int] = None
+        self._inventory: Optional[Dict[str, int]] = None            # Name -> Anzahl
+        self._effects: Optional[List[Optional[Effect]]] = None      # Index = EFFECT_KEYS
+        self._extra: Optional[Dict[str, Any]] = None                # unbekannte Felder (Round-Trip)
+
+    # ---- dict-artiger Zugriff auf skalare Felder
+    def __getitem__(self, key: str):
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value):
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        if key == "job":
+            value = _intern(value)
+        elif key == "job_offers":
+            value = tuple(sys.intern(name) for name in value)
+        setattr(self, key, value)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in _FIELD_SET else default
+
+    # ---- Inventar
+    @property
+    def inventory(self) -> Dict[str, int]:
+        return dict(self._inventory) if self._inventory else {}
+
+    def add_item(self, name: str, count: int = 1):
+        if self._inventory is None:
+            self._inventory = {}
+        name = sys.intern(name)
+        self._inventory[name] = self._inventory.get(name, 0) + count
+
+    # ---- Effekte
+    def effect(self, key: str) -> Optional[Effect]:
+        # Rohwert, auch wenn bereits abgelaufen (siehe core.effect_active)
+        if self._effects is None:
+            return None
+        return self._effects[_EFFECT_SLOTS[key]]
+
+    def set_effect(self, key: str, until: Optional[int], percent: int = 0):
+        if self._effects is None:
+            self._effects = [None] * len(EFFECT_KEYS)
+        self._effects[_EFFECT_SLOTS[key]] = Effect(until, percent)
+
+    def clear_effect(self, key: str):
+        if self._effects is None:
+            return
+        self._effects[_EFFECT_SLOTS[key]] = None
+        if not any(self._effects):
+            self._effects = None
+
+    def effects(self) -> Iterator[Tuple[str, Effect]]:
+        if self._effects is None:
+            return iter(())
+        return ((key, eff) for key, eff in zip(EFFECT_KEYS, self._effects) if eff is not None)
+
+    # ---- Kopie / Vergleich (Transaktionen)
+    def copy(self) -> "UserProfile":
+        other = UserProfile.__new__(UserProfile)
+        for name in UserProfile.__slots__:
+            setattr(other, name, getattr(self, name))
+        if self._inventory is not None:
+            other._inventory = dict(self._inventory)
+        if self._effects is not None:
+            other._effects = list(self._effects)
+        if self._extra is not None:
+            other._extra = copy.deepcopy(self._extra)
+        return other
+
+    def restore(self, other: "UserProfile"):
+        # in-place, damit bestehende Referenzen gültig bleiben; übernimmt other
+        for name in UserProfile.__slots__:
+            setattr(self, name, getattr(other, name))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, UserProfile):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in UserProfile.__slots__)
+
+    __hash__ = None
+
+    # ---- JSON-Layout
+    def to_dict(self) -> Dict[str, Any]:
+        inventory = [name for name, n in (self._inventory or {}).items() for _ in range(n)]
+        effects: Dict[str, Any] = {}
+        for key, eff in self.effects():
+            effects[key] = {"until": eff.until, "percent": eff.percent} if key in _PERCENT_EFFECTS else {"until": eff.until}
+        d = {
+            "wallet": self.wallet,
+            "bank": self.bank,
+            "inventory": inventory,
+            "job": self.job,
+            "income": self.income,
+            "last_pay": self.last_pay,
+            "job_offers": list(self.job_offers),
+            "offers_expires": self.offers_expires,
+            "last_interest": self.last_interest,
+            "interest_carry": self.interest_carry,
+            "effects": effects,
+            "rob_cooldown_until": self.rob_cooldown_until,
+        }
+        if self._extra:
+            extra = dict(self._extra)
+            effects.update(extra.pop("effects", {}))
+            d.update(extra)
+        return d
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "UserProfile":
+        p = cls(int(d.get("wallet", 0)), int(d.get("bank", 0)), d.get("job"), int(d.get("income", 0)),
+                d.get("last_pay"), d.get("last_interest"))
+        p.job_offers = tuple(sys.intern(name) for name in d.get("job_offers") or ())
+        p.offers_expires = d.get("offers_expires")
+        p.interest_carry = float(d.get("interest_carry", 0.0))
+        p.rob_cooldown_until = d.get("rob_cooldown_until")
+        for name in d.get("inventory") or ():
+            p.add_item(name)
+        extra: Dict[str, Any] = {}
+        for key, eff in (d.get("effects") or {}).items():
+            if key in _EFFECT_SLOTS:
+                p.set_effect(key, eff.get("until"), int(eff.get("percent", 0)))
+            else:
+                extra.setdefault("effects", {})[key] = eff
+        for key, value in d.items():
+            if key not in _FIELD_SET and key not in ("inventory", "effects"):
+                extra[key] = value
+        p._extra = extra or None
+        return p